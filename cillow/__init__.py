@@ -1,9 +1,19 @@
 from . import types
-from .client import Client
+from .client import AsyncClient, Client
 from .interpreter import Interpreter
 from .patch import add_patches, clear_patches
 from .patch import prebuilt as prebuilt_patches
 from .server import Server
 from .switchable import Switchable
 
-__all__ = "add_patches", "Client", "Interpreter", "prebuilt_patches", "clear_patches", "Server", "Switchable", "types"
+__all__ = (
+    "AsyncClient",
+    "Client",
+    "Interpreter",
+    "Server",
+    "Switchable",
+    "add_patches",
+    "clear_patches",
+    "prebuilt_patches",
+    "types",
+)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import pickle
-from collections.abc import Generator
-from typing import Any, Callable
+import asyncio
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import Any, Callable, cast
 from uuid import uuid4
 
+import msgspec
 import zmq
+import zmq.asyncio
 
 from .interpreter import default_stream_processor
 from .types import (
@@ -15,6 +18,7 @@ from .types import (
     Execution,
     GetPythonEnvironment,
     InstallRequirements,
+    InterpreterResponse,
     ModifyInterpreter,
     PythonEnvironment,
     Result,
@@ -22,9 +26,29 @@ from .types import (
     RunCommand,
     SetEnvironmentVariables,
     Stream,
+    encode_message,
 )
 
-__all__ = ("Client",)
+__all__ = "AsyncClient", "Client"
+
+
+_RESPONSE_DECODER = msgspec.msgpack.Decoder(InterpreterResponse)
+"""Decoder for responses streamed during code or command execution"""
+
+# Responses arrive as a single frame whose first byte tags the message
+# type, so the per-frame dispatch is one integer comparison.
+_DONE = ord("d")
+_EXC = ord("e")
+_INTERP = ord("i")
+
+
+def _as_environment(value: Any) -> Any:
+    """Convert a decoded environment value back to a `PythonEnvironment`."""
+    if isinstance(value, list):
+        return [_as_environment(item) for item in value]
+    if isinstance(value, str) and value != "$system":
+        return Path(value)
+    return value
 
 
 class Client:
@@ -82,8 +106,18 @@ class Client:
             port: The port to connect to (defaults to 5556)
             environment: The default python environment to use (defaults to "$system")
         """
-        self._socket = zmq.Context().socket(zmq.DEALER)
-        self._socket.identity = id.encode()
+        self._socket: zmq.Socket[bytes] = zmq.Context.instance().socket(zmq.DEALER)
+        self._socket.setsockopt(zmq.IDENTITY, id.encode())
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        # Unbounded HWMs so rapid streams of small frames are never
+        # silently dropped or block the IO thread mid-request.
+        self._socket.setsockopt(zmq.SNDHWM, 0)
+        self._socket.setsockopt(zmq.RCVHWM, 0)
+
+        # Timeouts are enforced by the socket itself (RCVTIMEO), so a
+        # blocking recv is the whole wait path - no poll call needed.
+        self._socket.setsockopt(zmq.RCVTIMEO, -1)
 
         self._url = f"tcp://{host or 'localhost'}:{port or 5556}"
         self._socket.connect(self._url)
@@ -130,6 +164,7 @@ class Client:
     @request_timeout.setter
     def request_timeout(self, value: int) -> None:
         self.__timeout = value
+        self._socket.setsockopt(zmq.RCVTIMEO, -1 if value is None else value)
 
     @property
     def default_environment(self) -> PythonEnvironment:
@@ -150,42 +185,68 @@ class Client:
         """All running interpreter's python environments."""
         return self._get_return_value(GetPythonEnvironment(type="all"))  # type: ignore[no-any-return]
 
-    def _send_request(self, request_dataclass: Any) -> Generator[tuple[bytes, bytes], None, bytes]:
+    def _send_request(self, request_dataclass: Any) -> Generator[tuple[int, memoryview], None, memoryview]:
         """
         Send a request to the server and get response generator. This is a blocking operation.
 
+        Frames are received without copying; each body is a memoryview over
+        the underlying ZMQ buffer, which the decoders consume directly.
+
         Args:
             request_dataclass: Dataclass to send as request
 
         Yields:
-            A tuple of message type and body
+            A tuple of message type tag and body
         """
-        self._socket.send_multipart([b"", pickle.dumps(request_dataclass)], flags=zmq.NOBLOCK)
-        poller = zmq.Poller()
-        poller.register(self._socket, zmq.POLLIN)
+        self._socket.send_multipart([b"", encode_message(request_dataclass)], flags=zmq.NOBLOCK)
 
-        if not poller.poll(self.__timeout):
-            raise TimeoutError("Request timed out")
+        while True:
+            # Drain messages already queued in the receive buffer without
+            # blocking; only an empty buffer pays for a blocking recv.
+            if cast("int", self._socket.getsockopt(zmq.EVENTS)) & zmq.POLLIN:
+                frames = self._socket.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            else:
+                try:
+                    frames = self._socket.recv_multipart(copy=False)
+                except zmq.Again:
+                    raise TimeoutError("Request timed out") from None
+
+            payload: memoryview = frames[1].buffer
+            msg_type, body = payload[0], payload[1:]
+            if msg_type == _DONE:
+                return body
+            if msg_type == _EXC:
+                raise Exception(bytes(body).decode())
+            yield msg_type, body
+
+    def _call(self, request_dataclass: Any) -> bytes:
+        """
+        Send a non-streaming request and return the terminal body. This is a blocking operation.
 
-        try:
-            while True:
-                frames = self._socket.recv_multipart()
-                msg_type, body = frames[1], frames[2]
-                if msg_type == b"request_done":
-                    return body
-                if msg_type == b"request_exception":
-                    raise Exception(body.decode())
-                yield msg_type, body
-        finally:
-            poller.unregister(self._socket)
+        Args:
+            request_dataclass: Dataclass to send as request
+
+        Returns:
+            The body of the `request_done` frame
+        """
+        self._socket.send_multipart([b"", encode_message(request_dataclass)], flags=zmq.NOBLOCK)
 
-    def _get_return_value(self, request_dataclass: Any) -> Any:
-        gen = self._send_request(request_dataclass)
         while True:
             try:
-                next(gen)
-            except StopIteration as e:
-                return pickle.loads(e.value)
+                frames = self._socket.recv_multipart()
+            except zmq.Again:
+                raise TimeoutError("Request timed out") from None
+
+            payload: bytes = frames[1]
+            msg_type, body = payload[0], payload[1:]
+            if msg_type == _DONE:
+                return body
+            if msg_type == _EXC:
+                raise Exception(body.decode())
+            raise RuntimeError(f"Unexpected streaming frame {chr(msg_type)!r} for {request_dataclass!r}")
+
+    def _get_return_value(self, request_dataclass: Any) -> Any:
+        return _as_environment(msgspec.msgpack.decode(self._call(request_dataclass)))
 
     def switch_interpreter(self, environment: PythonEnvironment | str) -> None:
         """
@@ -196,7 +257,7 @@ class Client:
         Args:
             environment: The Python environment to use
         """
-        self.__current_environment = self._get_return_value(ModifyInterpreter(environment, mode="switch"))
+        self.__current_environment = self._get_return_value(ModifyInterpreter(str(environment), mode="switch"))
 
     def delete_interpreter(self, environment: PythonEnvironment | str) -> None:
         """
@@ -207,7 +268,7 @@ class Client:
         Args:
             environment: The Python environment to use
         """
-        self.__current_environment = self._get_return_value(ModifyInterpreter(environment, mode="delete"))
+        self.__current_environment = self._get_return_value(ModifyInterpreter(str(environment), mode="delete"))
 
     def set_environment_variables(self, environment_variables: dict[str, str]) -> None:
         """
@@ -234,11 +295,12 @@ class Client:
             on_stream: The callback to capture streaming output.
         """
         on_stream = on_stream or default_stream_processor
+        decode = _RESPONSE_DECODER.decode
         for msg_type, body in self._send_request(RunCommand(cmd=cmd)):
-            if msg_type != b"interpreter":
+            if msg_type != _INTERP:
                 continue
 
-            on_stream(pickle.loads(body))
+            on_stream(decode(body))
 
     # fmt: off
     def install_requirements(
@@ -252,11 +314,12 @@ class Client:
             requirements: The requirements to install
         """
         on_stream = on_stream or default_stream_processor
+        decode = _RESPONSE_DECODER.decode
         for msg_type, body in self._send_request(InstallRequirements(requirements)):
-            if msg_type != b"interpreter":
+            if msg_type != _INTERP:
                 continue
 
-            on_stream(pickle.loads(body))
+            on_stream(decode(body))
 
     # fmt: off
     def run_code(
@@ -277,27 +340,53 @@ class Client:
         """
         on_stream = on_stream or default_stream_processor
         result, streams, byte_streams, exception = Result(value=None), [], [], None
+
+        # Hot loop: the decoder method and socket are bound to locals so
+        # each chunk skips the LOAD_GLOBAL/LOAD_METHOD pairs.
+        decode = _RESPONSE_DECODER.decode
+        socket = self._socket
+
+        # Consecutive Stream chunks of the same type that arrive within
+        # one recv burst are coalesced into a single callback dispatch.
+        pending_type: str | None = None
+        pending_parts: list[str] = []
+
+        def flush_pending() -> None:
+            nonlocal pending_type
+            if pending_parts:
+                merged = Stream(type=pending_type, data="".join(pending_parts))  # type: ignore[arg-type]
+                streams.append(merged)
+                on_stream(merged)
+                pending_parts.clear()
+                pending_type = None
+
         for msg_type, body in self._send_request(RunCode(code=code)):
-            if msg_type != b"interpreter":
+            if msg_type != _INTERP:
                 continue
 
-            response = pickle.loads(body)
-            if isinstance(response, Result):
+            response = decode(body)
+            response_cls = type(response)
+            if response_cls is Stream:
+                if pending_type is not None and pending_type != response.type:
+                    flush_pending()
+                pending_type = response.type
+                pending_parts.append(response.data)
+                # Never delay delivery: only keep buffering while more
+                # frames are already queued on the socket.
+                if not cast("int", socket.getsockopt(zmq.EVENTS)) & zmq.POLLIN:
+                    flush_pending()
+            elif response_cls is ByteStream:
+                flush_pending()
+                byte_streams.append(response)
+                on_stream(response)
+            elif response_cls is Result:
                 result = response
-                continue
-            elif isinstance(response, ExceptionInfo):
+            else:
                 exception = response
-                continue
-
-            if isinstance(response, Stream):
-                streams.append(response)
-            elif isinstance(response, ByteStream):
-                byte_streams.append(response)
-
-            on_stream(response)
 
+        flush_pending()
         return Execution(
-            result=result, streams=streams, byte_streams=byte_streams, exception=exception
+            result=result, streams=tuple(streams), byte_streams=tuple(byte_streams), exception=exception
         )
 
     def disconnect(self) -> None:
@@ -310,7 +399,330 @@ class Client:
             ...
 
         self._socket.close()
-        self._socket.context.term()
+
+    @classmethod
+    def shutdown_context(cls) -> None:
+        """
+        Terminate the shared ZMQ context.
+
+        All clients share one process-wide context; only call this once no
+        client sockets are in use (e.g. test teardown or process exit).
+        """
+        zmq.Context.instance().term()
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         self.disconnect()
+
+
+class AsyncClient:
+    """
+    Asynchronous cillow client interface built on `zmq.asyncio`.
+
+    A single event loop can multiplex many concurrent clients (and thus
+    interpreter executions) without dedicating an OS thread to each.
+
+    Examples:
+        >>> import asyncio
+        >>> import cillow
+        >>>
+        >>> async def main():
+        ...     client = await cillow.AsyncClient.new()  # Connect as a new client
+        ...     # OR
+        ...     client = await cillow.AsyncClient.connect(id="<uid>")  # Connect as an existing client
+        ...
+        ...     execution = await client.run_code("print('Hello World')")
+        ...     await client.install_requirements("pkg-name1", "pkg-name2")
+        ...     await client.run_command("echo", "Hello World")
+        ...     await client.switch_interpreter("/path/to/python/env")
+        ...     await client.disconnect()
+        >>>
+        >>> asyncio.run(main())
+    """
+
+    def __init__(self, id: str, host: str | None = None, port: int | None = None) -> None:  # noqa: A002
+        """
+        Create the client socket without connecting an interpreter.
+
+        Use `AsyncClient.connect()` or `AsyncClient.new()` instead; the
+        initial interpreter switch requires a running event loop.
+
+        Args:
+            id: The client id
+            host: The host to connect to (defaults to localhost)
+            port: The port to connect to (defaults to 5556)
+        """
+        self._socket: zmq.asyncio.Socket = zmq.asyncio.Context.instance().socket(zmq.DEALER)
+        self._socket.setsockopt(zmq.IDENTITY, id.encode())
+        self._socket.setsockopt(zmq.LINGER, 0)
+        self._socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        self._socket.setsockopt(zmq.SNDHWM, 0)
+        self._socket.setsockopt(zmq.RCVHWM, 0)
+
+        self._url = f"tcp://{host or 'localhost'}:{port or 5556}"
+        self._socket.connect(self._url)
+
+        self.__id = id
+        self.__timeout: int | None = None
+        self.__current_environment: PythonEnvironment | None = None
+        self.__default_environment: PythonEnvironment | None = None
+
+    # fmt: off
+    @classmethod
+    async def connect(
+        cls,
+        id: str,  # noqa: A002
+        host: str | None = None,
+        port: int | None = None,
+        environment: PythonEnvironment | str = "$system"
+    ) -> AsyncClient:
+        # fmt: on
+        """
+        Connect to the server as an existing client.
+
+        Args:
+            id: The client id
+            host: The host to connect to (defaults to localhost)
+            port: The port to connect to (defaults to 5556)
+            environment: The default python environment to use (defaults to "$system")
+        """
+        client = cls(id, host=host, port=port)
+        await client.switch_interpreter(environment)
+        return client
+
+    # fmt: off
+    @classmethod
+    async def new(
+        cls,
+        host: str | None = None,
+        port: int | None = None,
+        environment: PythonEnvironment | str = "$system"
+    ) -> AsyncClient:
+        # fmt: on
+        """
+        Connect to the server as a new client.
+
+        Args:
+            host: The host to connect to (defaults to localhost)
+            port: The port to connect to (defaults to 5556)
+            environment: The default python environment to use (defaults to "$system")
+        """
+        return await cls.connect(str(uuid4()), host=host, port=port, environment=environment)
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    @property
+    def id(self) -> str:
+        """Client's identifier."""
+        return self.__id
+
+    @property
+    def request_timeout(self) -> int | None:
+        """Timeout for request in milliseconds."""
+        return self.__timeout
+
+    @request_timeout.setter
+    def request_timeout(self, value: int) -> None:
+        self.__timeout = value
+
+    @property
+    def current_environment(self) -> PythonEnvironment:
+        """Current interpreter's python environment."""
+        return self.__current_environment  # type: ignore[return-value]
+
+    async def get_default_environment(self) -> PythonEnvironment:
+        """Default Python environment."""
+        if self.__default_environment is None:
+            self.__default_environment = await self._get_return_value(GetPythonEnvironment(type="default"))
+        return self.__default_environment
+
+    async def get_all_environments(self) -> list[PythonEnvironment]:
+        """All running interpreter's python environments."""
+        return await self._get_return_value(GetPythonEnvironment(type="all"))  # type: ignore[no-any-return]
+
+    async def _recv_frames(self) -> list[bytes]:
+        recv = self._socket.recv_multipart()
+        if self.__timeout is None:
+            return await recv
+
+        try:
+            return await asyncio.wait_for(recv, timeout=self.__timeout / 1000)
+        except asyncio.TimeoutError:
+            raise TimeoutError("Request timed out") from None
+
+    async def _send_request(self, request_dataclass: Any) -> AsyncGenerator[tuple[int, bytes], None]:
+        """
+        Send a request to the server and get an async response generator.
+
+        Args:
+            request_dataclass: Dataclass to send as request
+
+        Yields:
+            A tuple of message type tag and body
+        """
+        await self._socket.send_multipart([b"", encode_message(request_dataclass)])
+
+        while True:
+            frames = await self._recv_frames()
+            payload = frames[1]
+            msg_type, body = payload[0], payload[1:]
+            if msg_type == _DONE:
+                return
+            if msg_type == _EXC:
+                raise Exception(body.decode())
+            yield msg_type, body
+
+    async def _call(self, request_dataclass: Any) -> bytes:
+        """
+        Send a non-streaming request and return the terminal body.
+
+        Args:
+            request_dataclass: Dataclass to send as request
+
+        Returns:
+            The body of the `request_done` frame
+        """
+        await self._socket.send_multipart([b"", encode_message(request_dataclass)])
+
+        while True:
+            frames = await self._recv_frames()
+            payload = frames[1]
+            msg_type, body = payload[0], payload[1:]
+            if msg_type == _DONE:
+                return body
+            if msg_type == _EXC:
+                raise Exception(body.decode())
+            raise RuntimeError(f"Unexpected streaming frame {chr(msg_type)!r} for {request_dataclass!r}")
+
+    async def _get_return_value(self, request_dataclass: Any) -> Any:
+        return _as_environment(msgspec.msgpack.decode(await self._call(request_dataclass)))
+
+    async def switch_interpreter(self, environment: PythonEnvironment | str) -> None:
+        """
+        Switch to specified python environment's interpreter process.
+
+        Creates a new interpreter process if it is not already running.
+
+        Args:
+            environment: The Python environment to use
+        """
+        self.__current_environment = await self._get_return_value(ModifyInterpreter(str(environment), mode="switch"))
+
+    async def delete_interpreter(self, environment: PythonEnvironment | str) -> None:
+        """
+        Stop the specified python environment's interpreter process.
+
+        Switches to default python environment's interpreter process.
+
+        Args:
+            environment: The Python environment to use
+        """
+        self.__current_environment = await self._get_return_value(ModifyInterpreter(str(environment), mode="delete"))
+
+    async def set_environment_variables(self, environment_variables: dict[str, str]) -> None:
+        """
+        Set environment variables for the current interpreter.
+
+        Args:
+            environment_variables: The environment variables to set
+        """
+        async for _ in self._send_request(SetEnvironmentVariables(environment_variables)):
+            ...
+
+    async def run_command(self, *cmd: str, on_stream: Callable[[Stream], None] | None = None) -> None:
+        """
+        Run the given command.
+
+        ⚠️ WARNING: This class allows execution of system commands and should be used with EXTREME CAUTION.
+
+        - Never run commands with user-supplied or untrusted input
+        - Always validate and sanitize any command arguments
+        - Be aware of potential security risks, especially with privilege escalation
+
+        Args:
+            cmd: The command to run
+            on_stream: The callback to capture streaming output.
+        """
+        on_stream = on_stream or default_stream_processor
+        decode = _RESPONSE_DECODER.decode
+        async for msg_type, body in self._send_request(RunCommand(cmd=cmd)):
+            if msg_type != _INTERP:
+                continue
+
+            on_stream(decode(body))
+
+    # fmt: off
+    async def install_requirements(
+        self, *requirements: str, on_stream: Callable[[Stream], None] | None = None
+    ) -> None:
+        # fmt: on
+        """
+        Install the given requirements in the current Python environment.
+
+        Args:
+            requirements: The requirements to install
+        """
+        on_stream = on_stream or default_stream_processor
+        decode = _RESPONSE_DECODER.decode
+        async for msg_type, body in self._send_request(InstallRequirements(requirements)):
+            if msg_type != _INTERP:
+                continue
+
+            on_stream(decode(body))
+
+    # fmt: off
+    async def run_code(
+        self,
+        code: str,
+        on_stream: Callable[[Stream | ByteStream], None] | None = None
+    ) -> Execution:
+        # fmt: on
+        """
+        Run the code in the current selected interpreter.
+
+        Args:
+            code: The code to run
+            on_stream: The callback to capture streaming output.
+
+        Returns:
+            The execution result containing the result, streams, byte streams and exception.
+        """
+        on_stream = on_stream or default_stream_processor
+        result = Result(value=None)
+        streams: list[Stream] = []
+        byte_streams: list[ByteStream] = []
+        exception: ExceptionInfo | None = None
+
+        decode = _RESPONSE_DECODER.decode
+        sinks: dict[type, Callable[[Any], None]] = {Stream: streams.append, ByteStream: byte_streams.append}
+        sink_get = sinks.get
+        async for msg_type, body in self._send_request(RunCode(code=code)):
+            if msg_type != _INTERP:
+                continue
+
+            response = decode(body)
+            if (append := sink_get(type(response))) is not None:
+                append(response)
+                on_stream(response)
+            elif type(response) is Result:
+                result = response
+            else:
+                exception = response
+
+        return Execution(
+            result=result, streams=tuple(streams), byte_streams=tuple(byte_streams), exception=exception
+        )
+
+    async def disconnect(self) -> None:
+        """
+        Close the connection to the server and remove the client.
+
+        Don't use this if you want to reconnect to the server later.
+        """
+        async for _ in self._send_request(Disconnect()):
+            ...
+
+        self._socket.close()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.disconnect()
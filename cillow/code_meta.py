@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 from dataclasses import dataclass
 from types import CodeType
-from typing import Literal
+from typing import Literal, cast
 
 from .modutils import extract_modules_from_ast_module
 
@@ -14,7 +14,7 @@ CompileMode = Literal["exec", "eval"]
 """Code Compilation Mode"""
 
 
-def compile_code(__code: ast.Module | str, filename: str, mode: CompileMode) -> CodeType:
+def compile_code(__code: ast.Module | ast.Expression | str, filename: str, mode: CompileMode) -> CodeType:
     """
     Compile the given code.
 
@@ -27,7 +27,9 @@ def compile_code(__code: ast.Module | str, filename: str, mode: CompileMode) ->
         Compiled code object
     """
     if isinstance(__code, str):
-        __code = ast.parse(__code, filename=filename, mode=mode)  # type: ignore[assignment]
+        # With a variable mode the ast.parse overloads collapse to the
+        # base ast.mod; exec/eval always yield Module/Expression.
+        __code = cast("ast.Module | ast.Expression", ast.parse(__code, filename=filename, mode=mode))
     return compile(__code, filename=filename, mode=mode)
 
 
@@ -64,13 +66,12 @@ class CodeMeta:
         to_exec, to_eval = None, None
         mod_copy = ast.Module(body=__mod.body.copy(), type_ignores=__mod.type_ignores)
 
-        if not hasattr(stmt := mod_copy.body[-1], "body"):
-            try:
-                to_eval = compile_code(ast.unparse(stmt), filename, "eval")
-                mod_copy.body.pop()
-            except SyntaxError:
-                # some statements, for example - imports, are not allowed in eval
-                pass
+        if type(stmt := mod_copy.body[-1]) is ast.Expr:
+            # Only expression statements are valid in eval mode; compiling
+            # the existing node directly avoids an unparse/re-parse round-trip
+            # and preserves the original line numbers.
+            to_eval = compile_code(ast.Expression(body=stmt.value), filename, "eval")
+            mod_copy.body.pop()
 
         if mod_copy.body:
             to_exec = compile_code(mod_copy, filename, "exec")
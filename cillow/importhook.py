@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import os
+import sys
+from functools import lru_cache
 from importlib.machinery import ModuleSpec
 from importlib.util import spec_from_file_location
 from pathlib import Path
+from stat import S_ISDIR
 
 from .types import PythonEnvironment
 
 __all__ = "EnvironmentImportHook", "validate_environment"
 
 
+@lru_cache(maxsize=128)
+def _validate_environment_path(environment: str) -> Path:
+    """Resolve and stat an environment path, memoized per string value."""
+    path = Path(environment).expanduser().resolve()
+    if not (path / "lib" / "site-packages").is_dir():
+        raise LookupError(f"Python environment {str(path)!r} is invalid or not found.")
+
+    return path
+
+
 def validate_environment(environment: PythonEnvironment | str) -> PythonEnvironment:
     """
     Validate the given environment.
 
+    Validation is memoized by the string form of the path: every request
+    for an already-seen environment skips the resolve and stat calls
+    (which otherwise run inside the client manager's lock). Failed
+    lookups are not cached, so an environment created later is picked up.
+
     Args:
         environment: The environment to validate
 
@@ -22,12 +41,9 @@ def validate_environment(environment: PythonEnvironment | str) -> PythonEnvironm
     Returns:
         The validated environment value
     """
-    if environment != "$system":
-        environment = Path(environment).expanduser().resolve()
-        if not (environment / "lib" / "site-packages").is_dir():
-            raise LookupError(f"Python environment {str(environment)!r} is invalid or not found.")
-
-    return environment
+    if environment == "$system":
+        return environment
+    return _validate_environment_path(str(environment))
 
 
 class EnvironmentImportHook:
@@ -56,6 +72,33 @@ class EnvironmentImportHook:
 
         self._environment = environment
         self._site_packages = site_packages
+        self._sp_str = str(site_packages)
+
+        self._spec_cache: dict[str, ModuleSpec] = {}
+        self._misses: set[str] = set()
+        self._top_level: frozenset[str] = frozenset()
+        self._listing_mtime = -1
+        self._refresh_top_level()
+
+    def _refresh_top_level(self) -> None:
+        """Rebuild the cached top-level listing if site-packages changed on disk."""
+        mtime = os.stat(self._sp_str).st_mtime_ns
+        if mtime == self._listing_mtime:
+            return
+
+        # DirEntry caches the file type from the directory read itself,
+        # so the whole listing costs one getdents with no per-entry stat.
+        names = set()
+        with os.scandir(self._sp_str) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    names.add(entry.name)
+                elif entry.name.endswith(".py"):
+                    names.add(entry.name[:-3])
+
+        self._top_level = frozenset(names)
+        self._misses.clear()
+        self._listing_mtime = mtime
 
     @property
     def environment(self) -> Path:
@@ -71,22 +114,69 @@ class EnvironmentImportHook:
         """
         Find the module spec for the given module name.
 
+        Top-level names are resolved against a cached listing of
+        site-packages, so misses (e.g. stdlib imports probing this hook)
+        skip the per-part stat calls entirely.
+
         Args:
             fullname: Fully qualified module name
 
         Returns:
             ModuleSpec object or None if the module is not found
         """
-        package = self._site_packages.joinpath(*fullname.split("."))
-
-        # Check for package directory with __init__.py
-        init_file = package / "__init__.py"
-        if package.is_dir() and init_file.is_file():
-            return spec_from_file_location(fullname, init_file)
+        if (spec := self._spec_cache.get(fullname)) is not None:
+            return spec
+
+        if fullname in self._misses:
+            return None
+
+        parts = fullname.split(".")
+        if parts[0] not in self._top_level:
+            # Pick up packages installed after the listing was built
+            # (e.g. by install_requirements) before declaring a miss.
+            self._refresh_top_level()
+            if parts[0] not in self._top_level:
+                self._misses.add(fullname)
+                return None
+
+        if (spec := self._probe(fullname, parts)) is not None:
+            self._spec_cache[fullname] = spec
+        else:
+            self._misses.add(fullname)
+        return spec
+
+    def _probe(self, fullname: str, parts: list[str]) -> ModuleSpec | None:
+        """Stat site-packages for a package directory or source file spec."""
+        # os.path on plain strings: pathlib object construction is
+        # measurable overhead at import-hook call rates.
+        base = os.path.join(self._sp_str, *parts)
+        try:
+            is_dir = S_ISDIR(os.stat(base).st_mode)
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            # Check for package directory with __init__.py
+            init_file = base + os.sep + "__init__.py"
+            if os.path.isfile(init_file) and (spec := spec_from_file_location(fullname, init_file)) is not None:
+                return spec
 
         # Check for single source file
-        src_file = package.with_suffix(".py")
-        if src_file.is_file():
+        src_file = base + ".py"
+        if os.path.isfile(src_file):
             return spec_from_file_location(fullname, src_file)
-
         return None
+
+    def install(self) -> None:
+        """Register the hook on `sys.meta_path` and its site-packages on `sys.path`."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        if self._sp_str not in sys.path:
+            sys.path.insert(0, self._sp_str)
+
+    def uninstall(self) -> None:
+        """Remove the hook from `sys.meta_path` and its site-packages from `sys.path`."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        if self._sp_str in sys.path:
+            sys.path.remove(self._sp_str)
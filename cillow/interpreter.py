@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import os
 import sys
+import weakref
 from shutil import which as find_executable
 from tempfile import NamedTemporaryFile
-from traceback import format_tb as format_traceback
+from time import monotonic
+from traceback import extract_tb
 from typing import Any, Callable
 
 from . import patch
 from .code_meta import CodeMeta
 from .importhook import EnvironmentImportHook
-from .modutils import MODULE_TO_PACKAGE_MAP, get_installed_modules
+from .modutils import MODULE_TO_PACKAGE_MAP, get_installed_modules, invalidate_installed_modules
+from .patch import prebuilt
 from .shell import shell
 from .types import ByteStream, ExceptionInfo, PythonEnvironment, Result, Stream
 
@@ -19,6 +22,12 @@ __all__ = ("Interpreter",)
 
 PIP_INSTALL_CMD = ("uv", "pip", "install") if find_executable("uv") else ("pip", "install")
 
+_STDLIB: frozenset[str] = sys.stdlib_module_names
+"""Top-level standard library module names, bound once at import time."""
+
+_STREAM_FLUSH_INTERVAL = 0.1
+"""Longest time (seconds) command output is buffered before being flushed."""
+
 
 class Interpreter:
     """
@@ -67,8 +76,17 @@ class Interpreter:
         self._import_hook = None
         if environment != "$system":
             self._import_hook = EnvironmentImportHook(environment)
-            sys.meta_path.insert(0, self._import_hook)
-            sys.path.insert(0, str(self._import_hook.site_packages))
+            self._import_hook.install()
+            # finalize instead of __del__: removes this specific hook even
+            # if the interpreter is only reclaimed at shutdown, without
+            # keeping the instance alive through a __del__ reference cycle.
+            self._finalizer = weakref.finalize(self, self._import_hook.uninstall)
+
+        self._refresh_known_modules()
+
+    def _refresh_known_modules(self) -> None:
+        """Rebuild the set of modules that never need auto-installing."""
+        self._known_modules = _STDLIB | get_installed_modules()
 
     @property
     def environment(self) -> PythonEnvironment:
@@ -77,12 +95,16 @@ class Interpreter:
 
     # fmt: off
     def run_command(
-        self, *cmd: str, on_stream: Callable[[Stream], Any] | None = None
+        self, *cmd: str, on_stream: Callable[[Stream], Any] | None = None, batch: int = 64,
+        stdin: str | None = None
     ) -> None:
         # fmt: on
         """
         Run the given command.
 
+        Output lines are coalesced into a single `Stream` per batch, so chatty
+        commands (e.g. pip installs) don't pay a callback per line.
+
         ⚠️ WARNING: This class allows execution of system commands and should be used with EXTREME CAUTION.
 
         - Never run commands with user-supplied or untrusted input
@@ -92,10 +114,21 @@ class Interpreter:
         Args:
             cmd: The command to run
             on_stream: The callback to capture streaming output.
+            batch: Maximum number of lines to coalesce into one stream.
+            stdin: Data to write to the command's standard input.
         """
         on_stream = on_stream or default_stream_processor
-        for line in shell.stream(*cmd):
-            on_stream(Stream(type="cmd_exec", data=line))
+        buffer: list[str] = []
+        flush_deadline = monotonic() + _STREAM_FLUSH_INTERVAL
+        for line in shell.stream(*cmd, stdin=stdin):
+            buffer.append(line)
+            if len(buffer) >= batch or monotonic() >= flush_deadline:
+                on_stream(Stream(type="cmd_exec", data="".join(buffer)))
+                buffer.clear()
+                flush_deadline = monotonic() + _STREAM_FLUSH_INTERVAL
+
+        if buffer:
+            on_stream(Stream(type="cmd_exec", data="".join(buffer)))
 
     # fmt: off
     def install_requirements(
@@ -113,14 +146,24 @@ class Interpreter:
         if self._import_hook is not None:
             install_args = ["--python", str(self._import_hook.environment)]
 
-        with NamedTemporaryFile(mode="w") as handler:
-            # Writing requirements to file, instead of directly
-            # passing them as arguments, to avoid arbitrary command execution
-            handler.write("\n".join(requirements))
-            handler.flush()
-            install_args.extend(["-r", handler.name])
+        # Requirements travel as a requirements file, instead of directly
+        # passing them as arguments, to avoid arbitrary command execution
+        if PIP_INSTALL_CMD[0] == "uv":
+            # uv reads the requirements file from stdin; no temp file needed
+            install_args.extend(["-r", "-"])
+            self.run_command(
+                *PIP_INSTALL_CMD, *install_args, on_stream=on_stream, stdin="\n".join(requirements)
+            )
+        else:
+            with NamedTemporaryFile(mode="w") as handler:
+                handler.write("\n".join(requirements))
+                handler.flush()
+                install_args.extend(["-r", handler.name])
+
+                self.run_command(*PIP_INSTALL_CMD, *install_args, on_stream=on_stream)
 
-            self.run_command(*PIP_INSTALL_CMD, *install_args, on_stream=on_stream)
+        invalidate_installed_modules()
+        self._refresh_known_modules()
 
     def run_code(
         self, code: str, on_stream: Callable[[Stream | ByteStream], None] | None = None
@@ -142,7 +185,8 @@ class Interpreter:
 
         on_stream = on_stream or default_stream_processor
         if not is_auto_install_disabled() and (module_names := code_meta.module_names):
-            to_install = (module_names - sys.stdlib_module_names) - get_installed_modules()
+            known_modules = self._known_modules
+            to_install = [name for name in module_names if name not in known_modules]
             if to_install:
                 packages = [MODULE_TO_PACKAGE_MAP.get(name, name) for name in to_install]
                 self.install_requirements(*packages, on_stream=on_stream)
@@ -164,15 +208,13 @@ class Interpreter:
                 "message": str(exc),
             }
             if tb := exc.__traceback__:
-                exc_info["where"] = format_traceback(tb)[-1].strip()
+                # Only the last frame is reported; formatting the whole
+                # traceback would pull source lines for every frame.
+                frame = extract_tb(tb, limit=-1)[-1]
+                exc_info["where"] = f'File "{frame.filename}", line {frame.lineno}, in {frame.name}'
 
             return ExceptionInfo(**exc_info)
 
-    def __del__(self) -> None:
-        if self._import_hook:
-            sys.meta_path.pop(0)
-            sys.path.pop(0)
-
 
 def is_auto_install_disabled() -> bool:
     """Check if auto-install is disabled."""
@@ -188,21 +230,23 @@ def is_running_in_jupyter() -> bool:
         return False
 
 
+_STREAM_DISPATCH = {
+    "stdout": (prebuilt.stdout_write_switchable, "[STDOUT] "),
+    "stderr": (prebuilt.stderr_write_switchable, "[STDERR] "),
+    "cmd_exec": (prebuilt.stdout_write_switchable, "[SHELL] "),
+}
+"""Write switchable and display prefix per stream type."""
+
+
 def default_stream_processor(stream: Stream | ByteStream) -> None:
     """Interpreter's default stream processor."""
     if isinstance(stream, Stream):
-        if stream.type == "stdout":
-            original = patch.prebuilt.stdout_write_switchable.original
-            prefix = "[STDOUT] "
-        elif stream.type == "stderr":
-            original = patch.prebuilt.stderr_write_switchable.original
-            prefix = "[STDERR] "
-        else:
-            original = patch.prebuilt.stdout_write_switchable.original
-            prefix = "[SHELL] "
-
-        data = f"{prefix}{stream.data}" if stream.data.strip() else stream.data
-        original(data)
+        switchable, prefix = _STREAM_DISPATCH[stream.type]
+        data = stream.data
+        # isspace runs at C level; strip() would allocate a copy per write
+        if data and not data.isspace():
+            data = prefix + data
+        switchable.original(data)
         return
 
     if stream.type == "image":
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import ast
-from importlib.metadata import distributions
+import os
+import sys
 
 MODULE_TO_PACKAGE_MAP = {
     "bs4": "beautifulsoup4",
@@ -18,47 +19,6 @@ MODULE_TO_PACKAGE_MAP = {
 """Mapping of modules to packages that don't have the same name"""
 
 
-class _ImportVisitor(ast.NodeVisitor):
-    """Internal class for extracting module names from an AST module"""
-
-    def __init__(self) -> None:
-        self.module_names: set[str] = set()
-
-    def visit_Import(self, node: ast.Import) -> None:
-        for alias in node.names:
-            self.module_names.add(alias.name.split(".")[0])
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        if node.level == 0 and node.module:
-            self.module_names.add(node.module.split(".")[0])
-
-    def visit_If(self, node: ast.If) -> None:
-        self.visit(node.test)
-
-        for stmt in node.body:
-            self.visit(stmt)
-
-        if node.orelse:
-            for stmt in node.orelse:
-                self.visit(stmt)
-
-    def visit_Try(self, node: ast.Try) -> None:
-        for stmt in node.body:
-            self.visit(stmt)
-
-        for handler in node.handlers:
-            for stmt in handler.body:
-                self.visit(stmt)
-
-        if node.orelse:
-            for stmt in node.orelse:
-                self.visit(stmt)
-
-        if node.finalbody:
-            for stmt in node.finalbody:
-                self.visit(stmt)
-
-
 def extract_modules_from_ast_module(__mod: ast.Module) -> set[str]:
     """
     Extract the module names from an AST module.
@@ -69,9 +29,22 @@ def extract_modules_from_ast_module(__mod: ast.Module) -> set[str]:
     Returns:
         Set of module names
     """
-    visitor = _ImportVisitor()
-    visitor.visit(__mod)
-    return visitor.module_names
+    # Iterative walk instead of ast.NodeVisitor: avoids the per-node
+    # getattr dispatch, which dominates the cost of scanning small trees.
+    module_names: set[str] = set()
+    stack: list[ast.AST] = [__mod]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is ast.Import:
+            for alias in node.names:  # type: ignore[attr-defined]
+                module_names.add(alias.name.partition(".")[0])
+        elif node_type is ast.ImportFrom:
+            if node.level == 0 and node.module:  # type: ignore[attr-defined]
+                module_names.add(node.module.partition(".")[0])  # type: ignore[attr-defined]
+        else:
+            stack.extend(ast.iter_child_nodes(node))
+    return module_names
 
 
 def extract_modules_from_code(__code: str) -> set[str]:
@@ -84,25 +57,62 @@ def extract_modules_from_code(__code: str) -> set[str]:
     Returns:
         Set of module names
     """
+    # Cheap substring test before paying for a full parse: code without
+    # the word "import" anywhere cannot contain an import statement.
+    if "import" not in __code:
+        return set()
+
     return extract_modules_from_ast_module(ast.parse(__code))
 
 
+_installed_modules_cache: set[str] | None = None
+
+
 def get_installed_modules() -> set[str]:
     """
     Get all installed module names.
 
+    The distribution scan is cached after the first call; use
+    `invalidate_installed_modules` after installing or removing packages.
+
     Returns:
         Set of module names
     """
-
-    modules = set()
-    for dist in distributions():
+    global _installed_modules_cache
+    if _installed_modules_cache is not None:
+        return _installed_modules_cache
+
+    # Scan metadata directories directly instead of constructing an
+    # importlib.metadata.Distribution per package, which stats every
+    # dist's metadata files through several abstraction layers.
+    modules: set[str] = set()
+    for path in sys.path:
         try:
-            if top_level := dist.read_text("top_level.txt"):
-                modules.update(top_level.splitlines())
-            else:
-                modules.add(dist.name)
-        except Exception:  # noqa: S112
+            entries = os.scandir(path or ".")
+        except OSError:
             continue
 
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith((".dist-info", ".egg-info")):
+                    continue
+
+                try:
+                    with open(os.path.join(entry.path, "top_level.txt"), encoding="utf-8") as handler:
+                        modules.update(line for line in handler.read().splitlines() if line)
+                except OSError:
+                    # No top_level.txt: fall back to the distribution name.
+                    # Versionless dirs (e.g. "cillow.egg-info") have no "-"
+                    # to split on, so drop the metadata extension first.
+                    stem = name.rsplit(".", 1)[0]
+                    modules.add(stem.partition("-")[0])
+
+    _installed_modules_cache = modules
     return modules
+
+
+def invalidate_installed_modules() -> None:
+    """Drop the cached result of `get_installed_modules`."""
+    global _installed_modules_cache
+    _installed_modules_cache = None
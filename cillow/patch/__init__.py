@@ -1,6 +1,7 @@
 from collections.abc import Generator
 from contextlib import ExitStack, contextmanager
 from inspect import signature
+from types import CodeType
 from typing import Any, Callable, ContextManager, Protocol  # noqa: UP035
 
 from ..types import ByteStream, Stream
@@ -24,6 +25,17 @@ _patches_with_callback: list[StreamCapturePatchProtcol] = []
 _patches_without_callback: list[PatchProtocol] = []
 
 
+def _takes_callback(patch: PatchProtocol | StreamCapturePatchProtcol) -> bool:
+    """Whether the patch accepts the stream-capture callback."""
+    # Reading co_argcount off the (unwrapped) code object is far cheaper
+    # than building an inspect.Signature; fall back for non-function callables.
+    func = getattr(patch, "__wrapped__", patch)
+    code: CodeType | None = getattr(func, "__code__", None)
+    if code is not None:
+        return code.co_argcount + code.co_kwonlyargcount != 0
+    return len(signature(patch).parameters) != 0
+
+
 def add_patches(*patches: PatchProtocol | StreamCapturePatchProtcol) -> None:
     """
     Add new patches to be used by all Interpreter instances.
@@ -32,10 +44,10 @@ def add_patches(*patches: PatchProtocol | StreamCapturePatchProtcol) -> None:
         patches: The context manager callables to add
     """
     for patch in patches:
-        if len(signature(patch).parameters) == 0:
-            _patches_without_callback.append(patch)  # type: ignore[arg-type]
-        else:
+        if _takes_callback(patch):
             _patches_with_callback.append(patch)  # type: ignore[arg-type]
+        else:
+            _patches_without_callback.append(patch)  # type: ignore[arg-type]
 
 
 @contextmanager
@@ -46,6 +58,12 @@ def load_patches(on_stream: Callable[[Stream | ByteStream], Any]) -> Generator[N
     Args:
         on_stream: The callback to capture streaming output.
     """
+    # Fast path: no patches registered, skip the ExitStack bookkeeping
+    # that run_code would otherwise pay on every call.
+    if not _patches_with_callback and not _patches_without_callback:
+        yield
+        return
+
     with ExitStack() as stack:
         for patch_fn in _patches_without_callback:
             stack.enter_context(patch_fn())
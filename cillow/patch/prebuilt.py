@@ -1,38 +1,127 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import partial
 from io import BytesIO
 from sys import stderr as sys_stderr
 from sys import stdout as sys_stdout
+from threading import local as thread_local
 from typing import Any, Callable
 
-from matplotlib import pyplot
-from matplotlib import use as use_backend
-from PIL import Image
-
 from ..switchable import Switchable
 from ..types import ByteStream, Stream
 
 stdout_write_switchable = Switchable(sys_stdout.write)
 stderr_write_switchable = Switchable(sys_stderr.write)
 
+# Constructors pre-bound with their constant stream type, so the
+# per-write path skips keyword-argument parsing.
+_stdout_stream = partial(Stream, "stdout")
+_stderr_stream = partial(Stream, "stderr")
+
+
+_lazy_switchables: dict[str, Switchable] = {}
+"""Switchables over heavy third-party callables, built on first use."""
+
+_tls = thread_local()
+
+
+def _shared_buffer() -> BytesIO:
+    """Reusable per-thread buffer for encoding captured figures."""
+    buffer = getattr(_tls, "buffer", None)
+    if buffer is None:
+        buffer = _tls.buffer = BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate()
+    return buffer
+
+
+def _get_switchable(name: str) -> Switchable:
+    """Get a lazily-built switchable, importing its library on first use."""
+    switchable = _lazy_switchables.get(name)
+    if switchable is None:
+        if name.startswith("matplotlib"):
+            from matplotlib import pyplot
+            from matplotlib import use as use_backend
+
+            _lazy_switchables["matplotlib_pyplot_show_switchable"] = Switchable(pyplot.show)
+            _lazy_switchables["matplotlib_use_backend_switchable"] = Switchable(use_backend)
+        else:
+            from PIL import Image
+
+            _lazy_switchables["pillow_show_switchable"] = Switchable(Image._show)
+        switchable = _lazy_switchables[name]
+    return switchable
+
+
+def __getattr__(name: str) -> Switchable:
+    # Importing matplotlib and PIL costs hundreds of ms and megabytes;
+    # defer them until the corresponding switchable is actually needed.
+    if name in ("matplotlib_pyplot_show_switchable", "matplotlib_use_backend_switchable", "pillow_show_switchable"):
+        return _get_switchable(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_FLUSH_THRESHOLD = 4096
+"""Buffered writes are flushed once this many characters accumulate."""
+
+
+class _StreamBatcher:
+    """
+    Coalesces consecutive writes into one Stream per flush.
+
+    A flush happens when a write carries a newline, when the buffer
+    crosses the threshold, and unconditionally on patch exit — so
+    `print(i) for i in range(N)` costs one Stream per line instead of
+    two callback dispatches per print (text and newline separately).
+    """
+
+    __slots__ = ("_callback", "_make_stream", "_parts", "_size")
+
+    def __init__(self, make_stream: Callable[[str], Stream], callback: Callable[[Stream], Any]) -> None:
+        self._make_stream = make_stream
+        self._callback = callback
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, s: str) -> int:
+        self._parts.append(s)
+        self._size += len(s)
+        if "\n" in s or self._size >= _FLUSH_THRESHOLD:
+            self.flush()
+        return len(s)
+
+    def flush(self) -> None:
+        if self._parts:
+            data = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            self._callback(self._make_stream(data))
+
 
 @contextmanager
 def patch_stdout_stderr_write(callback: Callable[[Stream], Any]) -> Generator[None, None, None]:
     """
     Patch the `write` method of `sys.stdout` and `sys.stderr`.
 
+    Writes are batched per stream and delivered to the callback at
+    newline boundaries (or a 4 KiB threshold); anything still buffered
+    is flushed when the patch exits.
+
     Args:
         callback: The callback to process the string content.
     """
-    with (
-        stdout_write_switchable.switch_to(lambda s: callback(Stream(type="stdout", data=s))),
-        stderr_write_switchable.switch_to(lambda s: callback(Stream(type="stderr", data=s))),
-    ):
-        yield
-
-
-matplotlib_pyplot_show_switchable = Switchable(pyplot.show)
-matplotlib_use_backend_switchable = Switchable(use_backend)
+    stdout_batcher = _StreamBatcher(_stdout_stream, callback)
+    stderr_batcher = _StreamBatcher(_stderr_stream, callback)
+    try:
+        with (
+            stdout_write_switchable.switch_to(stdout_batcher.write),
+            stderr_write_switchable.switch_to(stderr_batcher.write),
+        ):
+            yield
+    finally:
+        stdout_batcher.flush()
+        stderr_batcher.flush()
 
 
 @contextmanager
@@ -43,28 +132,26 @@ def patch_matplotlib_pyplot_show(callback: Callable[[ByteStream], Any]) -> Gener
     Args:
         callback: The callback to process the figure image bytes.
     """
+    from matplotlib import pyplot
 
     def override_show(*args: Any, **kwargs: Any) -> Any:
-        buffer = BytesIO()
+        # Reuse one per-thread buffer instead of allocating a BytesIO
+        # per figure; only the final getvalue() snapshot is handed out.
+        buffer = _shared_buffer()
         try:
             pyplot.savefig(buffer, format="png")
-            buffer.seek(0)
 
             return callback(ByteStream(type="image", data=buffer.getvalue()))
         finally:
-            buffer.close()
             pyplot.close()
 
     with (
-        matplotlib_pyplot_show_switchable.switch_to(override_show),
-        matplotlib_use_backend_switchable.switch_to(lambda b, f=True: None),  # type: ignore[misc,arg-type]
+        _get_switchable("matplotlib_pyplot_show_switchable").switch_to(override_show),
+        _get_switchable("matplotlib_use_backend_switchable").switch_to(lambda b, f=True: None),  # type: ignore[misc]
     ):
         yield
 
 
-pillow_show_switchable = Switchable(Image._show)
-
-
 @contextmanager
 def patch_pillow_show(callback: Callable[[ByteStream], Any]) -> Generator[None, None, None]:
     """
@@ -73,11 +160,12 @@ def patch_pillow_show(callback: Callable[[ByteStream], Any]) -> Generator[None,
     Args:
         callback: The callback to process the image bytes.
     """
+    from PIL import Image
 
     def override_show(image: Image.Image, **options: Any) -> Any:
         data = image._repr_image("PNG", compress_level=1)
         if data:
             return callback(ByteStream(type="image", data=data))
 
-    with pillow_show_switchable.switch_to(override_show):
+    with _get_switchable("pillow_show_switchable").switch_to(override_show):
         yield
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import suppress
 from queue import Full as QueueFullError
 from queue import Queue
 from signal import Signals, signal
@@ -99,21 +100,35 @@ class Server(Logger):
         self.logger.info(f"Number of worker threads: {num_worker_threads}")
         self.logger.info(f"Max request queue size: {max_queue_size}")
 
-        self._request_queue = Queue(maxsize=max_queue_size)  # type: ignore[var-annotated]
+        # One queue per worker, sharded by client id: producers and
+        # consumers contend pairwise instead of on one shared lock, and a
+        # client's requests stay ordered because they always land on the
+        # same worker.
+        self._request_queues = [
+            Queue(maxsize=max_queue_size)  # type: ignore[var-annotated]
+            for _ in range(num_worker_threads)
+        ]
+
+        # Message type travels as a 1-byte tag prefixed to the body, so
+        # each response is two frames instead of three.
+        tags = {b"request_done": b"d", b"request_exception": b"e", b"interpreter": b"i"}
 
         def send_cb(client_id: bytes, msg_type: bytes, msg_body: bytes) -> None:
-            self.socket.send_multipart([client_id, b"", msg_type, msg_body])
+            # copy=False sends large bodies (e.g. image byte streams)
+            # zero-copy; buffers under zmq.COPY_THRESHOLD are still copied,
+            # so small stream chunks don't pay the zero-copy bookkeeping.
+            self.socket.send_multipart([client_id, b"", tags[msg_type] + msg_body], copy=False)
 
         self._callback = send_cb
         self._server_event = ThreadEvent()
         self._request_workers = [
             RequestWorker(
-                self._request_queue,
+                request_queue,
                 self._client_manager,
                 self._callback,  # type: ignore[arg-type]
                 self._server_event,
             )
-            for _ in range(num_worker_threads)
+            for request_queue in self._request_queues
         ]
 
     def run(self) -> None:
@@ -123,38 +138,56 @@ class Server(Logger):
         for worker in self._request_workers:
             worker.start()
 
-        signal(Signals.SIGINT, lambda s, f: self._server_event.set())
-        signal(Signals.SIGTERM, lambda s, f: self._server_event.set())
+        # PAIR pipe for instant wakeup: the signal handler writes a byte,
+        # so the poll below needs no timeout and shutdown is immediate.
+        context = self.socket.context
+        shutdown_recv = context.socket(zmq.PAIR)
+        shutdown_recv.bind("inproc://cillow-server-shutdown")
+        shutdown_send = context.socket(zmq.PAIR)
+        shutdown_send.connect("inproc://cillow-server-shutdown")
+
+        def on_shutdown_signal(signum, frame) -> None:  # type: ignore[no-untyped-def]
+            self._server_event.set()
+            with suppress(zmq.ZMQError):
+                shutdown_send.send(b"", flags=zmq.NOBLOCK)
+
+        signal(Signals.SIGINT, on_shutdown_signal)
+        signal(Signals.SIGTERM, on_shutdown_signal)
 
         self._server_event.clear()
 
+        poller = zmq.Poller()
+        poller.register(self.socket, zmq.POLLIN)
+        poller.register(shutdown_recv, zmq.POLLIN)
+
         try:
             self.logger.info(f"Listening on {self._url}")
             self.logger.info("Press Ctrl+C to exit.")
             while not self._server_event.is_set():
-                if not self.socket.poll(timeout=1000):
+                events = dict(poller.poll())
+                if self.socket not in events:
                     continue
 
-                try:
-                    frames = self.socket.recv_multipart(flags=zmq.NOBLOCK)
-                    if len(frames) != 3:
-                        self._callback(frames[0], b"request_exception", b"Invalid number of frames received")
-
-                    client_id, _, request_bytes = frames
-                    try:
-                        self._request_queue.put_nowait((client_id, request_bytes))
-                    except QueueFullError:
-                        self._callback(
-                            client_id, b"request_exception", b"Server request queue is full. Try again later."
-                        )
+                # The poller already guarantees a message is ready, so the
+                # receive can block without NOBLOCK/except overhead.
+                frames = self.socket.recv_multipart()
+                if len(frames) != 3:
+                    self._callback(frames[0], b"request_exception", b"Invalid number of frames received")
+                    continue
 
-                except zmq.ZMQError:
-                    pass
+                client_id, _, request_bytes = frames
+                try:
+                    shard = self._request_queues[hash(client_id) % len(self._request_queues)]
+                    shard.put_nowait((client_id, request_bytes))
+                except QueueFullError:
+                    self._callback(client_id, b"request_exception", b"Server request queue is full. Try again later.")
 
         except Exception as e:
             self.logger.error(f"{e.__class__.__name__}: {e!s}")
 
         finally:
+            shutdown_send.close()
+            shutdown_recv.close()
             self.logger.info("Cleaning up resources...")
             self._client_manager.cleanup()
 
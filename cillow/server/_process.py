@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import atexit
+import threading
 from collections.abc import Generator
-from multiprocessing import Event as MpEvent
-from multiprocessing import Process
-from multiprocessing import Queue as MpQueue
+from multiprocessing import get_context
+from multiprocessing.queues import SimpleQueue
 from multiprocessing.synchronize import Event as MpEventType
-from queue import Empty as EmptyQueueError
-from typing import Any
+from queue import Empty, Full, Queue
+from typing import Any, Callable
 
 from ..interpreter import Interpreter
-from ..types import PythonEnvironment
+from ..types import PythonEnvironment, Stream
 
-__all__ = ("_InterpreterProcess",)
+__all__ = ("_InterpreterPool", "_InterpreterProcess")
+
+
+try:
+    # forkserver: children are forked from a clean helper process with the
+    # heavy modules preloaded, so each interpreter skips re-importing them
+    # and never forks the multi-threaded server process directly.
+    _mp_context = get_context("forkserver")
+    _mp_context.set_forkserver_preload(["cillow.interpreter"])
+except ValueError:  # pragma: no cover - platforms without forkserver
+    _mp_context = get_context()  # type: ignore[assignment]
 
 
 class _InterpreterProcess:
@@ -26,12 +37,15 @@ class _InterpreterProcess:
         Args:
             environment: The Python environment to use
         """
-        self._input_queue = MpQueue()  # type: ignore[var-annotated]
-        self._output_queue = MpQueue()  # type: ignore[var-annotated]
-        self._process_event = MpEvent()
+        self.environment = environment
+        # SimpleQueue writes to the pipe synchronously: no feeder thread and
+        # no per-queue buffer between user code's stdout and the server.
+        self._input_queue: SimpleQueue[Any] = _mp_context.SimpleQueue()
+        self._output_queue: SimpleQueue[Any] = _mp_context.SimpleQueue()
+        self._process_event = _mp_context.Event()
 
         # fmt: off
-        self._process = Process(
+        self._process = _mp_context.Process(
             target=_process_event_loop, args=(
                 environment, self._input_queue, self._output_queue, self._process_event
             )
@@ -42,15 +56,22 @@ class _InterpreterProcess:
     def _send_input(self, **kwargs: Any) -> Generator[Any, None, None]:
         self._input_queue.put(kwargs)
         while True:
-            try:
-                output = self._output_queue.get(timeout=1)
+            # Drain everything already queued so a burst of small stream
+            # chunks (e.g. many prints) collapses into fewer responses —
+            # one encode and one socket send each — instead of one per
+            # chunk. Only chunks already sitting in the queue are merged,
+            # so output never waits on a timer.
+            batch = [self._output_queue.get()]
+            while batch[-1] is not _completed and not self._output_queue.empty():
+                batch.append(self._output_queue.get())
 
-                if output is _completed:
-                    break
-                yield output
+            done = batch[-1] is _completed
+            if done:
+                batch.pop()
 
-            except EmptyQueueError:
-                continue
+            yield from _coalesce_streams(batch)
+            if done:
+                return
 
     def stop(self) -> None:
         """Stop the interpreter process."""
@@ -70,12 +91,151 @@ class _InterpreterProcess:
         self._output_queue.close()
 
 
+class _InterpreterPool:
+    """
+    Warm pool of never-used interpreter processes keyed by environment.
+
+    Acquiring pops a pre-spawned process when one is available (and kicks
+    off a background refill), hiding process-spawn latency from the
+    caller. Only fresh processes ever enter the pool; used interpreters
+    carry client namespaces and must be stopped, not recycled.
+
+    Every process — warm spare or handed out — holds one slot claimed
+    through `reserve`, so spares count against the server's process limit
+    instead of silently exceeding it; under limit pressure, acquire
+    evicts spares to free their slots.
+
+    This is not supposed to be used directly. It backs ClientManager.
+    """
+
+    def __init__(
+        self,
+        per_environment: int = 1,
+        reserve: Callable[[], bool] | None = None,
+        release: Callable[[], None] | None = None,
+    ):
+        """
+        Args:
+            per_environment: Number of warm processes kept per environment
+            reserve: Claims one slot against the process limit, returning success
+            release: Gives back one previously claimed slot
+        """
+        self._per_environment = per_environment
+        self._reserve = reserve or (lambda: True)
+        self._release = release or (lambda: None)
+        self._lock = threading.Lock()
+        self._warm: dict[PythonEnvironment, Queue[_InterpreterProcess]] = {}
+        atexit.register(self.drain)
+
+    def _queue_for(self, environment: PythonEnvironment) -> Queue[_InterpreterProcess]:
+        with self._lock:
+            if (queue := self._warm.get(environment)) is None:
+                queue = self._warm[environment] = Queue(maxsize=self._per_environment)
+            return queue
+
+    def _refill(self, environment: PythonEnvironment, queue: Queue[_InterpreterProcess]) -> None:
+        # The slot was claimed by the acquire that started this thread.
+        process = _InterpreterProcess(environment)
+        try:
+            queue.put_nowait(process)
+        except Full:
+            process.stop()
+            self._release()
+
+    def _evict_one(self) -> bool:
+        """Stop one warm spare to free its slot, returning whether one was found."""
+        with self._lock:
+            queues = list(self._warm.values())
+
+        for queue in queues:
+            try:
+                process = queue.get_nowait()
+            except Empty:
+                continue
+            process.stop()
+            self._release()
+            return True
+        return False
+
+    def acquire(self, environment: PythonEnvironment) -> _InterpreterProcess:
+        """
+        Get a warm process for the environment, spawning inline on a miss.
+
+        The returned process already holds a claimed slot.
+
+        Raises:
+            Exception: If the process limit leaves no slot to claim
+        """
+        queue = self._queue_for(environment)
+        try:
+            process = queue.get_nowait()
+        except Empty:
+            # Spares for other environments hold slots too, so evict them
+            # under limit pressure before giving up on a claim.
+            while not self._reserve():
+                if not self._evict_one():
+                    raise Exception("Unable to create new interpreter due to process limit.") from None
+            process = _InterpreterProcess(environment)
+
+        # Top up the warm pool only with leftover slot capacity, claiming
+        # the refill's slot here so it can't race the acquire itself.
+        if not queue.full() and self._reserve():
+            threading.Thread(target=self._refill, args=(environment, queue), daemon=True).start()
+
+        return process
+
+    def offer(self, process: _InterpreterProcess) -> None:
+        """Return a never-used process to the pool, stopping it if the pool is full."""
+        try:
+            self._queue_for(process.environment).put_nowait(process)
+        except Full:
+            process.stop()
+            self._release()
+
+    def drain(self) -> None:
+        """Stop all warm processes."""
+        with self._lock:
+            queues = list(self._warm.values())
+            self._warm.clear()
+
+        for queue in queues:
+            while True:
+                try:
+                    queue.get_nowait().stop()
+                except Empty:
+                    break
+                self._release()
+
+
+def _coalesce_streams(responses: list[Any]) -> Generator[Any, None, None]:
+    """Merge consecutive same-type `Stream` chunks in a drained batch into one."""
+    pending_type = None
+    pending_parts: list[str] = []
+    for response in responses:
+        if type(response) is Stream:
+            if pending_type == response.type:
+                pending_parts.append(response.data)
+                continue
+            if pending_type is not None:
+                yield Stream(type=pending_type, data="".join(pending_parts))
+            pending_type, pending_parts = response.type, [response.data]
+            continue
+
+        if pending_type is not None:
+            yield Stream(type=pending_type, data="".join(pending_parts))
+            pending_type = None
+        yield response
+
+    if pending_type is not None:
+        yield Stream(type=pending_type, data="".join(pending_parts))
+
+
 class _completed:
     """A sentinel value to indicate to stop reading from the output queue."""
 
 
 def _process_event_loop(
-    environment: PythonEnvironment, input_queue: MpQueue, output_queue: MpQueue, process_event: MpEventType
+    environment: PythonEnvironment, input_queue: SimpleQueue, output_queue: SimpleQueue, process_event: MpEventType
 ) -> None:
     """
     The main loop that runs in the separate process.
@@ -90,9 +250,10 @@ def _process_event_loop(
 
     instance = Interpreter(environment)
     try:
+        # One request at a time: the owning worker blocks on _completed
+        # before sending the next input, so the queue never holds more.
         while not process_event.is_set():
             request = input_queue.get()
-
             if "code" in request:
                 output_queue.put(instance.run_code(request["code"], on_stream=output_queue.put))
             elif "cmd" in request:
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import multiprocessing
 import threading
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import msgspec
 
 from ..importhook import validate_environment
 from ..logger import Logger
 from ..types import PythonEnvironment
-from ._process import _InterpreterProcess
+from ._process import _InterpreterPool, _InterpreterProcess
 
 __all__ = (
     "ClientInfo",
@@ -15,21 +18,40 @@ __all__ = (
 )
 
 
-@dataclass(frozen=True)
-class CurrentContext:
+# msgspec structs rather than dataclasses: attribute reads on these are
+# on the per-request path, and C-level slot access plus cheaper
+# construction beats __dict__ lookups for records this hot.
+class CurrentContext(msgspec.Struct, frozen=True):
     """Current context information"""
 
     environment: PythonEnvironment
     interpreter: _InterpreterProcess
 
 
-@dataclass
-class ClientInfo:
+class ClientInfo(msgspec.Struct):
     """Client information"""
 
     current: CurrentContext
     default_environment: PythonEnvironment
     interpreters: dict[PythonEnvironment, _InterpreterProcess]
+    lock: Any = msgspec.field(default_factory=threading.Lock)
+    """Serializes mutations of this client's own state."""
+
+
+def _stop_all(interpreters: list[_InterpreterProcess]) -> None:
+    """
+    Stop interpreter processes in parallel.
+
+    Each stop blocks on a terminate + join, so stopping N processes in a
+    thread pool takes roughly the slowest stop instead of their sum.
+    """
+    if len(interpreters) <= 1:
+        for interpreter in interpreters:
+            interpreter.stop()
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(interpreters))) as executor:
+        list(executor.map(_InterpreterProcess.stop, interpreters))
 
 
 class ClientManager(Logger):
@@ -52,8 +74,20 @@ class ClientManager(Logger):
         self.interpreters_per_client = interpreters_per_client or min(2, self.max_interpreters)
         self.max_clients = self.max_interpreters // self.interpreters_per_client
 
+        # Lock order (outermost first): self._lock -> ClientInfo.lock ->
+        # self._count_lock. The global lock guards only membership of
+        # _clients — the per-request read path (get_info) is lock-free,
+        # so only the rare membership mutations contend here; each
+        # client's own state serializes on its ClientInfo lock, so clients
+        # mutate their interpreters in parallel; the counter lock makes
+        # limit check + increment one atomic step.
         self._lock = threading.Lock()
         self._clients: dict[str, ClientInfo] = {}
+        self._count_lock = threading.Lock()
+        self._active_interpreters = 0
+        # Slots are claimed by the pool at spawn and travel with the
+        # process, so warm spares count against max_interpreters too.
+        self._pool = _InterpreterPool(reserve=self._try_reserve_interpreter, release=self._release_interpreters)
 
     @property
     def optimal_number_of_request_workers(self) -> int:
@@ -68,7 +102,20 @@ class ClientManager(Logger):
     @property
     def total_active_processes(self) -> int:
         """Get total number of active interpreter processes."""
-        return sum(len(client.interpreters) for client in self._clients.values())
+        return self._active_interpreters
+
+    def _try_reserve_interpreter(self) -> bool:
+        """Atomically claim one slot against the total process limit."""
+        with self._count_lock:
+            if self._active_interpreters < self.max_interpreters:
+                self._active_interpreters += 1
+                return True
+            return False
+
+    def _release_interpreters(self, count: int = 1) -> None:
+        """Give back previously claimed process slots."""
+        with self._count_lock:
+            self._active_interpreters -= count
 
     def register(self, client_id: str, environment: PythonEnvironment | str = "$system") -> None:
         """
@@ -91,18 +138,41 @@ class ClientManager(Logger):
                 raise Exception("Client limit exceeded. Try again later.")
 
             environment = validate_environment(environment or "$system")
-            interpreter = _InterpreterProcess(environment)
-            self._clients[client_id] = ClientInfo(
-                default_environment=environment,
-                current=CurrentContext(environment=environment, interpreter=interpreter),
-                interpreters={environment: interpreter},
-            )
+
+        # Acquired outside the lock: a warm pool hit returns instantly and
+        # even a miss only stalls this caller, not every other worker.
+        interpreter = self._pool.acquire(environment)
+
+        surplus = None
+        try:
+            with self._lock:
+                # Re-validate; another thread may have registered this
+                # client or taken the last slot while we were spawning.
+                if client_id in self._clients:
+                    surplus = interpreter
+                    return
+
+                if not len(self._clients) < self.max_clients:
+                    surplus = interpreter
+                    raise Exception("Client limit exceeded. Try again later.")
+
+                # The acquired process already holds its claimed slot.
+                self._clients[client_id] = ClientInfo(
+                    default_environment=environment,
+                    current=CurrentContext(environment=environment, interpreter=interpreter),
+                    interpreters={environment: interpreter},
+                )
             self.logger.info(f"Client {client_id!r} joined the server with {str(environment)!r} environment")
+        finally:
+            if surplus is not None:
+                self._pool.offer(surplus)
 
     def get_info(self, client_id: str) -> ClientInfo | None:
         """Get client info"""
-        with self._lock:
-            return self._clients.get(client_id)
+        # A single dict read is atomic under the GIL and every mutation
+        # installs or removes whole entries, so the per-request lookup
+        # doesn't need to touch the lock at all.
+        return self._clients.get(client_id)
 
     def switch_interpreter(self, client_id: str, environment: PythonEnvironment | str) -> PythonEnvironment:
         """
@@ -120,27 +190,53 @@ class ClientManager(Logger):
         Returns:
             The valid Python environment value
         """
-        with self._lock:
-            if (client_info := self._clients.get(client_id)) is None:
-                raise ValueError(f"Client {client_id!r} not found.")
+        if (client_info := self._clients.get(client_id)) is None:
+            raise ValueError(f"Client {client_id!r} not found.")
 
+        with client_info.lock:
             environment = validate_environment(environment)
             if client_info.current.environment == environment:
                 return environment
 
-            if not (interpreter := client_info.interpreters.get(environment)):
-                # Check if client and total process limits are met to create new interpreter
-                if (
-                    len(client_info.interpreters) < self.interpreters_per_client
-                    and self.total_active_processes < self.max_interpreters
-                ):
-                    interpreter = _InterpreterProcess(environment)
-                    client_info.interpreters[environment] = interpreter
+            if interpreter := client_info.interpreters.get(environment):
+                client_info.current = CurrentContext(environment=environment, interpreter=interpreter)
+                return environment
+
+            # Check the per-client limit only; the global limit is gated
+            # by the pool's acquire, which can evict warm spares (counted
+            # against the same counter) to free a slot.
+            if not len(client_info.interpreters) < self.interpreters_per_client:
+                raise Exception("Unable to create new interpreter due to process limit.")
+
+        # Acquired outside any lock so other clients aren't blocked on it.
+        new_interpreter = self._pool.acquire(environment)
+
+        surplus = None
+        try:
+            with client_info.lock:
+                # Re-validate; the client may have left or the limits may
+                # have been reached while we were spawning.
+                if self._clients.get(client_id) is not client_info:
+                    surplus = new_interpreter
+                    raise ValueError(f"Client {client_id!r} not found.")
+
+                if interpreter := client_info.interpreters.get(environment):
+                    surplus = new_interpreter
                 else:
-                    raise Exception("Unable to create new interpreter due to process limit.")
+                    # The acquired process already holds its claimed slot;
+                    # only the per-client limit needs re-checking here.
+                    if not len(client_info.interpreters) < self.interpreters_per_client:
+                        surplus = new_interpreter
+                        raise Exception("Unable to create new interpreter due to process limit.")
+
+                    interpreter = new_interpreter
+                    client_info.interpreters[environment] = interpreter
 
-            self._clients[client_id].current = CurrentContext(environment=environment, interpreter=interpreter)
-            return environment
+                client_info.current = CurrentContext(environment=environment, interpreter=interpreter)
+                return environment
+        finally:
+            if surplus is not None:
+                self._pool.offer(surplus)
 
     def delete_interpreter(self, client_id: str, environment: PythonEnvironment | str) -> None:
         """
@@ -150,13 +246,14 @@ class ClientManager(Logger):
             client_id: The client identifier
             environment: The environment associated with the interpreter
         """
-        with self._lock:
-            if (client_info := self._clients.get(client_id)) is None:
-                return
+        if (client_info := self._clients.get(client_id)) is None:
+            return
 
+        with client_info.lock:
             try:
                 environment = validate_environment(environment)
                 client_info.interpreters.pop(environment).stop()
+                self._release_interpreters()
             except KeyError:
                 return
 
@@ -168,17 +265,29 @@ class ClientManager(Logger):
             client_id: The client identifier
         """
         with self._lock:
-            if (client_info := self._clients.get(client_id)) is None:
+            if (client_info := self._clients.pop(client_id, None)) is None:
                 return
 
-            for interpreter in client_info.interpreters.values():
-                interpreter.stop()
-            del self._clients[client_id]
-            self.logger.info(f"Client {client_id!r} left the server")
+        # Stop processes outside the global lock; the client lock keeps an
+        # in-flight switch from adding an interpreter we'd never stop.
+        with client_info.lock:
+            interpreters = list(client_info.interpreters.values())
+            _stop_all(interpreters)
+            self._release_interpreters(len(interpreters))
+        self.logger.info(f"Client {client_id!r} left the server")
 
     def cleanup(self) -> None:
         """Stop all the interpreter processes."""
-        for info in self._clients.values():
-            for interpreter in info.interpreters.values():
-                interpreter.stop()
-        self._clients.clear()
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        interpreters: list[_InterpreterProcess] = []
+        for info in clients:
+            with info.lock:
+                interpreters.extend(info.interpreters.values())
+        _stop_all(interpreters)
+        self._pool.drain()
+
+        with self._count_lock:
+            self._active_interpreters = 0
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import pickle
+import sys
 from queue import Empty as QueueEmptyError
 from queue import Queue
 from threading import Event as ThreadEvent
 from threading import Thread
 from typing import TYPE_CHECKING, Any, Literal, Protocol, cast
 
+import msgspec
+from msgspec.structs import asdict as struct_asdict
+
 from ..logger import Logger
 from ..types import (
     Disconnect,
@@ -14,15 +17,24 @@ from ..types import (
     InstallRequirements,
     ModifyInterpreter,
     PythonEnvironment,
+    Request,
     RunCode,
     RunCommand,
     SetEnvironmentVariables,
+    encode_message,
 )
 
 if TYPE_CHECKING:
     from .client_manager import ClientManager
 
 
+_REQUEST_DECODER = msgspec.msgpack.Decoder(Request)
+"""Decoder for requests received from clients"""
+
+_MAX_BATCH = 32
+"""Maximum number of queued requests drained per queue-lock acquisition"""
+
+
 class WriteCallback(Protocol):
     """Callback protocol for writing messages to the client"""
 
@@ -52,43 +64,76 @@ class RequestWorker(Thread, Logger):
         self._client_manager = client_manager
         self._stop_event = stop_event
         self._callback = callback
+        # One hash lookup per request instead of an isinstance ladder
+        self._handlers: dict[type, Any] = {
+            GetPythonEnvironment: self._handle_get_environment,
+            ModifyInterpreter: self._handle_modify_interpreter,
+            SetEnvironmentVariables: self._handle_send_input,
+            InstallRequirements: self._handle_send_input,
+            RunCode: self._handle_send_input,
+            RunCommand: self._handle_send_input,
+            Disconnect: self._handle_disconnect,
+        }
         super().__init__(daemon=True)
 
-    def _get_python_environment(self, client_id: bytes, type: Literal["current", "all", "default"]) -> None:  # noqa: A002
+    def _handle_get_environment(self, client_id: bytes, client_id_str: str, request: GetPythonEnvironment) -> None:
+        self._get_python_environment(client_id, client_id_str, request.type)
+
+    def _handle_modify_interpreter(self, client_id: bytes, client_id_str: str, request: ModifyInterpreter) -> None:
+        self._modify_interpreter(client_id, client_id_str, request.environment, request.mode)
+
+    def _handle_send_input(self, client_id: bytes, client_id_str: str, request: Request) -> None:
+        self._send_input_to_interpreter(client_id, client_id_str, **struct_asdict(request))
+
+    def _handle_disconnect(self, client_id: bytes, client_id_str: str, request: Disconnect) -> None:
+        self._client_manager.remove(client_id_str)
+        self._callback(client_id, b"request_done", b"")
+
+    def _get_python_environment(
+        self,
+        client_id: bytes,
+        client_id_str: str,
+        type: Literal["current", "all", "default"],  # noqa: A002
+    ) -> None:
         """
         Get client's python environment of certain type.
 
         Args:
             client_id: The client id
+            client_id_str: The decoded client id
             type: The type of python environment to get
         """
-        if (client_info := self._client_manager.get_info(client_id.decode())) is None:
+        if (client_info := self._client_manager.get_info(client_id_str)) is None:
             return
 
         if type == "all":
-            self._callback(client_id, b"request_done", pickle.dumps(list(client_info.interpreters)))
+            self._callback(client_id, b"request_done", encode_message(list(client_info.interpreters)))
         elif type == "current":
-            self._callback(client_id, b"request_done", pickle.dumps(client_info.current.environment))
+            self._callback(client_id, b"request_done", encode_message(client_info.current.environment))
         elif type == "default":
-            self._callback(client_id, b"request_done", pickle.dumps(client_info.default_environment))
+            self._callback(client_id, b"request_done", encode_message(client_info.default_environment))
 
     def _modify_interpreter(
-        self, client_id: bytes, environment: PythonEnvironment | str, mode: Literal["switch", "delete"]
+        self,
+        client_id: bytes,
+        client_id_str: str,
+        environment: PythonEnvironment | str,
+        mode: Literal["switch", "delete"],
     ) -> None:
         """
         Modify the client's interpreter based on the given environment and mode.
 
         Args:
             client_id: The client id
+            client_id_str: The decoded client id
             environment: The environment to use
             mode: The mode to use
         """
-        client_id_str = client_id.decode()
         # fmt: off
         _switch = lambda env: self._callback(
             client_id,
             b"request_done",
-            pickle.dumps(self._client_manager.switch_interpreter(client_id_str, env))
+            encode_message(self._client_manager.switch_interpreter(client_id_str, env))
         )
         # fmt: on
         try:
@@ -102,51 +147,63 @@ class RequestWorker(Thread, Logger):
             print(str(e))
             self._callback(client_id, b"request_exception", str(e).encode())
 
-    def _send_input_to_interpreter(self, client_id: bytes, **kwargs: Any) -> None:
+    def _send_input_to_interpreter(self, client_id: bytes, client_id_str: str, **kwargs: Any) -> None:
         """
         Send input to interpreter.
 
         Args:
             client_id: The client id
+            client_id_str: The decoded client id
             **kwargs: The input data
         """
-        if (client_info := self._client_manager.get_info(client_id.decode())) is None:
+        if (client_info := self._client_manager.get_info(client_id_str)) is None:
             return
 
         for response in client_info.current.interpreter._send_input(**kwargs):
-            self._callback(client_id, b"interpreter", pickle.dumps(response))
+            self._callback(client_id, b"interpreter", encode_message(response))
 
         # Tell client to not wait for more responses
         self._callback(client_id, b"request_done", b"")
 
+    def _process(self, client_id: bytes, request_bytes: bytes) -> None:
+        """Decode, register and dispatch a single request."""
+        request = _REQUEST_DECODER.decode(request_bytes)
+        request_type = type(request)
+        # Decode (and intern) once; repeat requests from the same client
+        # then hit the client-table lookup with the same string object.
+        client_id_str = sys.intern(client_id.decode())
+        try:
+            if request_type is ModifyInterpreter:
+                # Register with default environment
+                self._client_manager.register(client_id_str, request.environment)
+            else:
+                self._client_manager.register(client_id_str)
+
+        except Exception as e:
+            self._callback(client_id, b"request_exception", str(e).encode())
+            return
+
+        if (handler := self._handlers.get(request_type)) is not None:
+            handler(client_id, client_id_str, request)
+
     def run(self) -> None:
         """Run the worker thread."""
         while not self._stop_event.is_set():
             try:
-                client_id, request_bytes = cast(tuple[bytes, bytes], self._queue.get(timeout=1))
-                request = pickle.loads(request_bytes)
-                try:
-                    client_id_str = client_id.decode()
-                    if isinstance(request, ModifyInterpreter):
-                        # Register with default environment
-                        self._client_manager.register(client_id_str, request.environment)
-                    else:
-                        self._client_manager.register(client_id_str)
-
-                except Exception as e:
-                    self._callback(client_id, b"request_exception", str(e).encode())
-                    continue
-
-                if isinstance(request, GetPythonEnvironment):
-                    self._get_python_environment(client_id, request.type)
-                elif isinstance(request, ModifyInterpreter):
-                    self._modify_interpreter(client_id, request.environment, request.mode)
-                elif isinstance(request, (SetEnvironmentVariables, InstallRequirements, RunCode, RunCommand)):
-                    self._send_input_to_interpreter(client_id, **request.__dict__)
-                elif isinstance(request, Disconnect):
-                    self._client_manager.remove(client_id.decode())
-                    self._callback(client_id, b"request_done", b"")
+                batch = [cast("tuple[bytes, bytes]", self._queue.get(timeout=1))]
             except QueueEmptyError:
                 continue
-            except Exception as e:
-                self.logger.error(f"{e.__class__.__name__}: {e!s}")
+
+            # Drain whatever else is already queued so one lock acquisition
+            # covers a burst of requests instead of one each.
+            try:
+                while len(batch) < _MAX_BATCH:
+                    batch.append(cast("tuple[bytes, bytes]", self._queue.get_nowait()))
+            except QueueEmptyError:
+                pass
+
+            for client_id, request_bytes in batch:
+                try:
+                    self._process(client_id, request_bytes)
+                except Exception as e:
+                    self.logger.error(f"{e.__class__.__name__}: {e!s}")
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import codecs
 import os
+import selectors
 import subprocess
 from collections.abc import Generator
 from pathlib import Path, PurePath
-from typing import Any, cast
+from queue import Queue
+from threading import Thread
+from typing import IO, Any, cast
 
 __all__ = ("Shell",)
 
 
+_USE_POWERSHELL = os.name == "nt" and "SHELL" not in os.environ
+"""Whether commands are routed through PowerShell, decided once at import."""
+
+
 class Shell:
     """
     Interface for running commands.
@@ -52,7 +60,7 @@ class Shell:
 
     @staticmethod
     def __validate_cmd(cmd: tuple[str, ...]) -> tuple[str, ...]:
-        if os.name == "nt" and "SHELL" not in os.environ:
+        if _USE_POWERSHELL:
             return ("powershell", "-NoProfile", "-NonInteractive", "-Command", *cmd)
         return cmd
 
@@ -61,10 +69,14 @@ class Shell:
         """The working directory."""
         return self.__workdir
 
-    def __prepare_common_kwargs(self, env: dict[str, str] | None = None) -> dict[str, Any]:
-        kwargs = {"cwd": self.__workdir, "text": True}
+    def __prepare_common_kwargs(self, env: dict[str, str] | None = None, *, text: bool = True) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"cwd": self.__workdir, "text": text}
         if env:
-            kwargs["env"] = {**os.environ, **env}
+            # os.environ is read live (not snapshotted at import) because
+            # interpreters update it at runtime via SetEnvironmentVariables.
+            merged = dict(os.environ)
+            merged.update(env)
+            kwargs["env"] = merged
         return kwargs
 
     def run(self, *cmd: str, env: dict[str, str] | None = None) -> str:
@@ -91,29 +103,114 @@ class Shell:
 
         return string
 
-    def stream(self, *cmd: str, env: dict[str, str] | None = None) -> Generator[str, Any, None]:
+    def stream(
+        self, *cmd: str, env: dict[str, str] | None = None, stdin: str | None = None
+    ) -> Generator[str, Any, None]:
         """
         Run a command and stream the output.
 
+        Both pipes are drained concurrently — multiplexed with a selector
+        on POSIX, one reader thread per pipe on Windows — so stderr and
+        stdout are yielded as the process produces them. Draining one pipe
+        to completion before the other (the old behavior) deadlocks once
+        the undrained pipe's buffer fills.
+
         Args:
             cmd: The arguments to pass as command
             env: Environment variables to set
+            stdin: Data to write to the command's standard input
 
         Returns:
-            Output stream of the executed command
+            Output stream of the executed command, line by line
         """
+        # Binary pipes: read1 needs the buffered raw stream, and chunk
+        # boundaries may split multibyte characters, which the per-pipe
+        # incremental decoders below handle.
         process = subprocess.Popen(  # noqa: S603
             self.__validate_cmd(cmd),
+            stdin=subprocess.PIPE if stdin is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            **self.__prepare_common_kwargs(env),
+            **self.__prepare_common_kwargs(env, text=False),
         )
 
-        if error := process.stderr:
-            yield from error
+        if stdin is not None and process.stdin:
+            process.stdin.write(stdin.encode())
+            process.stdin.close()
+
+        pipes = [pipe for pipe in (process.stderr, process.stdout) if pipe is not None]
+        if os.name == "nt":
+            # Windows selectors only support sockets (and non-blocking
+            # pipes need 3.12+), so fall back to reader threads there.
+            yield from self.__stream_threads(pipes)
+        else:
+            yield from self.__stream_selector(pipes)
 
-        if output := process.stdout:
-            yield from output
+        process.wait()
+
+    @staticmethod
+    def __stream_selector(pipes: list[IO[bytes]]) -> Generator[str, Any, None]:
+        decoder_factory = codecs.getincrementaldecoder("utf-8")
+        selector = selectors.DefaultSelector()
+        # Per pipe: incremental decoder and the trailing partial line
+        states: dict[Any, list[Any]] = {}
+        for pipe in pipes:
+            os.set_blocking(pipe.fileno(), False)
+            selector.register(pipe, selectors.EVENT_READ)
+            states[pipe] = [decoder_factory(errors="replace"), ""]
+
+        try:
+            while selector.get_map():
+                for key, _ in selector.select():
+                    readable = cast("IO[bytes]", key.fileobj)
+                    state = states[readable]
+                    if chunk := readable.read1(65536):  # type: ignore[attr-defined]
+                        if not (text := state[0].decode(chunk)):
+                            continue
+                        lines = (state[1] + text).splitlines(keepends=True)
+                        state[1] = "" if lines[-1].endswith("\n") else lines.pop()
+                        yield from lines
+                        continue
+
+                    # EOF on this pipe: flush the decoder and partial line
+                    selector.unregister(readable)
+                    if tail := state[1] + state[0].decode(b"", final=True):
+                        yield tail
+                        state[1] = ""
+        finally:
+            selector.close()
+
+    @staticmethod
+    def __stream_threads(pipes: list[IO[bytes]]) -> Generator[str, Any, None]:
+        decoder_factory = codecs.getincrementaldecoder("utf-8")
+        done = object()
+        output: Queue[Any] = Queue()
+
+        def drain(pipe: IO[bytes]) -> None:
+            decoder = decoder_factory(errors="replace")
+            tail = ""
+            try:
+                while chunk := pipe.read1(65536):  # type: ignore[attr-defined]
+                    if not (text := decoder.decode(chunk)):
+                        continue
+                    lines = (tail + text).splitlines(keepends=True)
+                    tail = "" if lines[-1].endswith("\n") else lines.pop()
+                    for line in lines:
+                        output.put(line)
+                if final := tail + decoder.decode(b"", final=True):
+                    output.put(final)
+            finally:
+                output.put(done)
+
+        for pipe in pipes:
+            Thread(target=drain, args=(pipe,), daemon=True).start()
+
+        pending = len(pipes)
+        while pending:
+            if (item := output.get()) is done:
+                pending -= 1
+            else:
+                yield item
 
 
 shell = Shell()
@@ -1,8 +1,9 @@
+from collections import deque
 from collections.abc import Generator
 from contextlib import contextmanager
 from inspect import getmodule
 from types import ModuleType
-from typing import Callable, Generic, ParamSpec, TypeVar
+from typing import Any, Callable, Generic, ParamSpec, TypeVar
 
 __all__ = "Switchable", "switch"
 
@@ -11,6 +12,37 @@ P_Spec = ParamSpec("P_Spec")
 T_Retval = TypeVar("T_Retval")
 
 
+class _SwitchContext:
+    """
+    Context manager backing `Switchable.switch_to`.
+
+    A plain class instead of `@contextmanager`: enter/exit are direct
+    method calls rather than a generator step each way, which matters
+    for hot nested switches.
+    """
+
+    __slots__ = ("_switchable", "_target")
+
+    def __init__(self, switchable: "Switchable", target: Callable) -> None:
+        self._switchable = switchable
+        self._target = target
+
+    def __enter__(self) -> None:
+        switchable = self._switchable
+        if (parent := switchable._parent) is None:
+            parent = switchable._resolve_parent()
+
+        # setattr first: if it fails, no switchable state has changed yet
+        setattr(parent, switchable._name, self._target)
+        switchable._target_stack.append(switchable._current_target)
+        switchable._current_target = self._target
+
+    def __exit__(self, *exc_info: object) -> None:
+        switchable = self._switchable
+        switchable._current_target = previous = switchable._target_stack.pop()
+        setattr(switchable._parent, switchable._name, previous)
+
+
 class Switchable(Generic[P_Spec, T_Retval]):
     """
     Create a switch from callable that can be replaced with another callable temporarily.
@@ -71,6 +103,10 @@ class Switchable(Generic[P_Spec, T_Retval]):
         5
     """
 
+    # Slots: callers going through the instance pay attribute loads on
+    # every call, and slot access skips the per-instance __dict__.
+    __slots__ = ("_current_target", "_name", "_original", "_parent", "_target_stack")
+
     def __init__(self, target: Callable[P_Spec, T_Retval]) -> None:
         """
         Initialize the switchable with the given callable.
@@ -78,6 +114,18 @@ class Switchable(Generic[P_Spec, T_Retval]):
         Args:
             target: The callable to override
         """
+        self._current_target = target
+        self._original = target  # Never rebound; `original` reads it directly
+        self._name = target.__name__
+        # Resolved lazily: inspection (getmodule walks sys.modules) only
+        # runs if the switchable is actually switched, so construction is
+        # O(1) and throwaway instances skip the work entirely.
+        self._parent: Any = None
+        self._target_stack: deque[Callable] = deque()  # For re-entrant context managers
+
+    def _resolve_parent(self) -> Any:
+        """Locate and memoize the object whose attribute gets rebound on switches."""
+        target = self._original
         if hasattr(target, "__self__"):
             module = getmodule(parent := target.__self__)
             variable = getattr(module, target.__name__, None)
@@ -99,18 +147,13 @@ class Switchable(Generic[P_Spec, T_Retval]):
             elif parent.__name__ == f"{os.name}path":
                 parent = os.path
 
-        self._current_target = target
-        self._name = target.__name__
         self._parent = parent
-        self._target_stack: list[Callable] = []  # For re-entrant context managers
+        return parent
 
     @property
     def original(self) -> Callable[P_Spec, T_Retval]:
         """Access the original callable."""
-        if self._target_stack:
-            return self._target_stack[0]
-
-        return self._current_target
+        return self._original
 
     def __call__(self, *args: P_Spec.args, **kwargs: P_Spec.kwargs) -> T_Retval:
         """
@@ -125,8 +168,7 @@ class Switchable(Generic[P_Spec, T_Retval]):
         """
         return self._current_target(*args, **kwargs)
 
-    @contextmanager
-    def switch_to(self, target: Callable[P_Spec, T_Retval]) -> Generator[None, None, None]:
+    def switch_to(self, target: Callable[P_Spec, T_Retval]) -> _SwitchContext:
         """
         Switch to another target callable temporarily.
 
@@ -136,15 +178,7 @@ class Switchable(Generic[P_Spec, T_Retval]):
         Args:
             target: The new target callable with same signature
         """
-        self._target_stack.append(self._current_target)
-        self._current_target = target
-
-        try:
-            setattr(self._parent, self._name, target)
-            yield
-        finally:
-            self._current_target = self._target_stack.pop()
-            setattr(self._parent, self._name, self._current_target)
+        return _SwitchContext(self, target)
 
 
 @contextmanager
@@ -1,110 +1,138 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Literal, Union
+
+import msgspec
 
 PythonEnvironment = Literal["$system"] | Path
 """Python environment type - either `$system` or a path to a python environment"""
 
+_ENV_TYPES = frozenset({"all", "current", "default"})
+"""Allowed values for `GetPythonEnvironment.type`"""
+
+_MODES = frozenset({"switch", "delete"})
+"""Allowed values for `ModifyInterpreter.mode`"""
+
+
+class _Message(msgspec.Struct, frozen=True, tag=True, tag_field="kind"):
+    """Base type for all request/response messages exchanged over the wire.
+
+    Each subclass is tagged with its class name so polymorphic unions can be
+    decoded without pickle.
+
+    `__post_init__` validators guard direct construction; they run only
+    under `__debug__`, so `python -O` strips them from the per-message
+    path. Decoding is validated independently by the typed decoders.
+    """
+
+
 # -----Request Types-----
 
 
-@dataclass(frozen=True)
-class GetPythonEnvironment:
+class GetPythonEnvironment(_Message, frozen=True):
     """Get python environment request type"""
 
     type: Literal["all", "current", "default"]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.type, str):
-            raise TypeError("Environment type must be a string")
+        if __debug__:
+            # Exact-type probe first: a pointer compare covers the common
+            # case, with isinstance kept as the subclass fallback.
+            if type(self.type) is not str and not isinstance(self.type, str):
+                raise TypeError("Environment type must be a string")
 
-        if self.type not in ["all", "current", "default"]:
-            raise ValueError("Environment type must be 'all', 'current' or 'default'")
+            if self.type not in _ENV_TYPES:
+                raise ValueError("Environment type must be 'all', 'current' or 'default'")
 
 
-@dataclass(frozen=True)
-class ModifyInterpreter:
+class ModifyInterpreter(_Message, frozen=True):
     """Modify interpreter request type"""
 
-    environment: PythonEnvironment | str
+    environment: str
+    """The python environment - either `$system` or a path to a python environment"""
     mode: Literal["switch", "delete"]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.environment, (str, Path)):
-            raise TypeError("environment must be a string or Path")
+        if __debug__:
+            if type(self.environment) not in (str, Path) and not isinstance(self.environment, (str, Path)):
+                raise TypeError("environment must be a string or Path")
 
-        if not isinstance(self.mode, str):
-            raise TypeError("mode must be a string")
+            if type(self.mode) is not str and not isinstance(self.mode, str):
+                raise TypeError("mode must be a string")
 
-        if self.mode not in ["switch", "delete"]:
-            raise ValueError("mode must be 'switch' or 'delete'")
+            if self.mode not in _MODES:
+                raise ValueError("mode must be 'switch' or 'delete'")
 
 
-@dataclass(frozen=True)
-class SetEnvironmentVariables:
+class SetEnvironmentVariables(_Message, frozen=True):
     """Set environment variables request type"""
 
     environment_variables: dict[str, str]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.environment_variables, dict):
-            raise TypeError("environment_variables must be a dictionary")
+        if __debug__:
+            if type(self.environment_variables) is not dict and not isinstance(self.environment_variables, dict):
+                raise TypeError("environment_variables must be a dictionary")
 
-        if not all(isinstance(k, str) and isinstance(v, str) for k, v in self.environment_variables.items()):
-            raise TypeError("environment_variables must be a dictionary of strings")
+            # map + bound instancecheck iterates at C level; a genexpr of
+            # isinstance calls pays a Python frame per element.
+            if not all(map(str.__instancecheck__, self.environment_variables)) or not all(
+                map(str.__instancecheck__, self.environment_variables.values())
+            ):
+                raise TypeError("environment_variables must be a dictionary of strings")
 
 
-@dataclass(frozen=True)
-class RunCommand:
+class RunCommand(_Message, frozen=True):
     """Run command request type"""
 
     cmd: tuple[str, ...]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.cmd, tuple):
-            raise TypeError("cmd must be a tuple")
+        if __debug__:
+            if type(self.cmd) is not tuple and not isinstance(self.cmd, tuple):
+                raise TypeError("cmd must be a tuple")
 
-        if not all(isinstance(c, str) for c in self.cmd):
-            raise TypeError("cmd must be a tuple of strings")
+            if not all(map(str.__instancecheck__, self.cmd)):
+                raise TypeError("cmd must be a tuple of strings")
 
 
-@dataclass(frozen=True)
-class InstallRequirements:
+class InstallRequirements(_Message, frozen=True):
     """Install requirements request type"""
 
     requirements: tuple[str, ...]
 
     def __post_init__(self) -> None:
-        if not isinstance(self.requirements, tuple):
-            raise TypeError("requirements must be a tuple")
+        if __debug__:
+            if type(self.requirements) is not tuple and not isinstance(self.requirements, tuple):
+                raise TypeError("requirements must be a tuple")
 
-        if not all(isinstance(r, str) for r in self.requirements):
-            raise TypeError("requirements must be a tuple of strings")
+            if not all(map(str.__instancecheck__, self.requirements)):
+                raise TypeError("requirements must be a tuple of strings")
 
 
-@dataclass(frozen=True)
-class RunCode:
+class RunCode(_Message, frozen=True):
     """Run code request type"""
 
     code: str
 
     def __post_init__(self) -> None:
-        if not isinstance(self.code, str):
+        if __debug__ and type(self.code) is not str and not isinstance(self.code, str):
             raise TypeError("code must be a string")
 
 
-@dataclass(frozen=True)
-class Disconnect:
+class Disconnect(_Message, frozen=True):
     """Disconnect request type"""
 
 
 # -----Response Types-----
 
 
-@dataclass(frozen=True)
-class Stream:
+# gc=False: one Stream per output chunk makes this the highest-cardinality
+# type in the system, and str/bytes fields can't form reference cycles, so
+# instances skip GC tracking entirely.
+class Stream(_Message, frozen=True, gc=False):
     """Stream response type generated during code or command execution"""
 
     type: Literal["stdout", "stderr", "cmd_exec"]
@@ -113,49 +141,89 @@ class Stream:
     """The stream data"""
 
 
-@dataclass(frozen=True)
-class ByteStream:
+class ByteStream(_Message, frozen=True, gc=False):
     """Byte stream response type generated during code execution"""
 
     type: Literal["image", "audio", "video"]
     """The byte stream type"""
     data: bytes
     """The byte stream data"""
-    id: str | None = field(default=None)
+    id: str | None = None
     """Identifier if stream data is of audio or video type"""
 
 
-@dataclass(frozen=True)
-class ExceptionInfo:
+class ExceptionInfo(_Message, frozen=True):
     """Exception information response type generated during code execution"""
 
     type: str
     """Exception type"""
     message: str
     """Exception message"""
-    where: str | None = field(default=None)
+    where: str | None = None
     """Where the exception occurred"""
 
     def __str__(self) -> str:
-        string = f"{self.type}: {self.message}"
+        # Single f-string per branch: no intermediate + concat allocation
         if self.where:
-            string += f"\n{self.where}"
-        return string
+            return f"{self.type}: {self.message}\n{self.where}"
+        return f"{self.type}: {self.message}"
 
 
-@dataclass(frozen=True)
-class Result:
+class Result(_Message, frozen=True):
     """Result response type generated during code execution"""
 
     value: Any
     """The result value"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Execution:
     """Final execution response type returned by the the client's run_code method"""
 
     result: Result
-    streams: list[Stream]
-    byte_streams: list[ByteStream]
-    exception: ExceptionInfo | None = field(default=None)
+    streams: tuple[Stream, ...]
+    byte_streams: tuple[ByteStream, ...]
+    exception: ExceptionInfo | None = None
+
+
+# -----Wire Serialization-----
+
+
+Request = Union[
+    GetPythonEnvironment,
+    ModifyInterpreter,
+    SetEnvironmentVariables,
+    RunCommand,
+    InstallRequirements,
+    RunCode,
+    Disconnect,
+]
+"""Union of all request types sent from the client to the server"""
+
+InterpreterResponse = Union[Result, Stream, ByteStream, ExceptionInfo]
+"""Union of all response types streamed back during code or command execution"""
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Fallback encoder for values msgpack doesn't support natively."""
+    if isinstance(obj, Path):
+        return str(obj)
+    # Arbitrary python objects (e.g. a `Result.value` from eval'd code)
+    # can't cross the wire as-is; fall back to their repr.
+    return repr(obj)
+
+
+_encoder = msgspec.msgpack.Encoder(enc_hook=_enc_hook)
+
+
+def encode_message(message: Any) -> bytes:
+    """
+    Encode a message to msgpack bytes.
+
+    Args:
+        message: The message to encode
+
+    Returns:
+        The encoded bytes
+    """
+    return _encoder.encode(message)
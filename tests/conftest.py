@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+
+def _create_fake_env(path) -> str:
+    """Create a fake Python environment under the given directory."""
+    env_path = Path(path) / "fake_env"
+    site_packages = env_path / "lib" / "site-packages"
+    site_packages.mkdir(parents=True)
+    return str(env_path)
+
+
+@pytest.fixture(scope="session")
+def fake_env(tmp_path_factory):
+    """A fake Python environment shared across the whole test session."""
+    return _create_fake_env(tmp_path_factory.mktemp("fake_env"))
+
+
+@pytest.fixture(scope="session")
+def fake_env_resolved(fake_env):
+    """The fake environment's resolved path, computed once per session.
+
+    `Path.resolve()` hits the filesystem; resolving here keeps repeated
+    assertions from paying that cost per call.
+    """
+    return Path(fake_env).resolve()
+
+
+@pytest.fixture(scope="session")
+def another_fake_env(tmp_path_factory):
+    """A second, distinct fake environment for tests that need two."""
+    return _create_fake_env(tmp_path_factory.mktemp("another_fake_env"))
@@ -40,7 +40,9 @@ def test_interpreter_initialization(tmp_env_path):
     assert env_interpreter.environment == tmp_env_path
     assert env_interpreter._import_hook is not None
 
-    env_interpreter.__del__()
+    hook = env_interpreter._import_hook
+    del env_interpreter
+    assert hook not in sys.meta_path
 
 
 def test_interpreter_run_command(interpreter):
@@ -83,7 +85,7 @@ def test_code_safety_with_patch(interpreter):
 @patch("cillow.interpreter.shell.stream")
 def test_install_requirements(mock_stream, interpreter):
     """Test package installation functionality"""
-    mock_stream.return_value = ["Installing...", "Successfully installed"]
+    mock_stream.return_value = ["Installing...\n", "Successfully installed\n"]
     mock_callback = Mock()
 
     interpreter.install_requirements("requests", on_stream=mock_callback)
@@ -92,9 +94,9 @@ def test_install_requirements(mock_stream, interpreter):
     args = mock_stream.call_args[0]
     assert "pip" in args[0] or "uv" in args[0]
 
+    # Output lines are coalesced into a single batched stream
     mock_callback.assert_has_calls([
-        call(Stream(type="cmd_exec", data="Installing...")),
-        call(Stream(type="cmd_exec", data="Successfully installed")),
+        call(Stream(type="cmd_exec", data="Installing...\nSuccessfully installed\n")),
     ])
 
 
@@ -117,7 +119,7 @@ def test_cleanup(tmp_env_path):
     original_meta_path_len = len(sys.meta_path)
     original_path_len = len(sys.path)
 
-    interpreter.__del__()
+    interpreter._finalizer()
 
     assert len(sys.meta_path) == original_meta_path_len - 1
     assert len(sys.path) == original_path_len - 1
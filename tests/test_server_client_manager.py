@@ -1,16 +1,19 @@
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from cillow.server.client_manager import ClientManager
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client_manager():
-    """Fixture for initializing the ClientManager."""
-    with patch("cillow.server.client_manager._InterpreterProcess") as MockInterpreterProcess:
+    """Fixture for initializing the ClientManager, shared across the module."""
+    # Imported here so collection (and deselected runs) skip the server
+    # package's transitive multiprocessing/interpreter imports.
+    from cillow.server.client_manager import ClientManager
+
+    with (
+        patch("cillow.server.client_manager._InterpreterProcess") as MockInterpreterProcess,
+        patch("cillow.server.client_manager._InterpreterPool"),
+    ):
         mock_interpreter = MagicMock()
         MockInterpreterProcess.return_value = mock_interpreter
         client_manager = ClientManager(max_interpreters=4, interpreters_per_client=2)
@@ -18,18 +21,13 @@ def client_manager():
         client_manager.cleanup()
 
 
-def _create_fake_env(path):
-    """Create a fake Python environment."""
-    env_path = Path(path) / "fake_env"
-    site_packages = env_path / "lib" / "site-packages"
-    site_packages.mkdir(parents=True)
-    return str(env_path)
-
-
-@pytest.fixture
-def fake_env(tmp_path):
-    """Fixture for creating a fake Python environment."""
-    return _create_fake_env(tmp_path)
+@pytest.fixture(autouse=True)
+def _reset_clients(client_manager):
+    """Give each test a clean client table without rebuilding the manager."""
+    yield
+    client_manager._clients.clear()
+    with client_manager._count_lock:
+        client_manager._active_interpreters = 0
 
 
 def test_optimal_number_of_request_workers(client_manager):
@@ -46,14 +44,14 @@ def test_optimal_max_queue_size(client_manager):
     )
 
 
-def test_register_client(client_manager, fake_env):
+def test_register_client(client_manager, fake_env, fake_env_resolved):
     """Test registering a client."""
     client_id = "client_1"
     client_manager.register(client_id, environment=fake_env)
 
     assert client_id in client_manager._clients
     client_info = client_manager._clients[client_id]
-    assert client_info.default_environment == Path(fake_env).resolve()
+    assert client_info.default_environment == fake_env_resolved
 
 
 def test_register_client_exceeds_limit(client_manager, fake_env):
@@ -65,26 +63,26 @@ def test_register_client_exceeds_limit(client_manager, fake_env):
         client_manager.register("new_client", environment=fake_env)
 
 
-def test_switch_interpreter(client_manager, fake_env):
+def test_switch_interpreter(client_manager, fake_env, fake_env_resolved):
     """Test switching interpreters."""
     client_id = "client_1"
     client_manager.register(client_id, environment=fake_env)
 
     new_environment = client_manager.switch_interpreter(client_id, environment=fake_env)
-    assert new_environment == Path(fake_env).resolve()
+    assert new_environment == fake_env_resolved
 
     client_info = client_manager._clients[client_id]
-    assert client_info.current.environment == Path(fake_env).resolve()
+    assert client_info.current.environment == fake_env_resolved
 
 
-def test_switch_interpreter_exceeds_limit(client_manager, fake_env):
+def test_switch_interpreter_exceeds_limit(client_manager, fake_env, another_fake_env):
     """Test switching interpreters exceeding process limits."""
     client_id = "client_1"
     client_manager.register(client_id)
     client_manager.switch_interpreter(client_id, environment=fake_env)
 
     with pytest.raises(Exception, match="Unable to create new interpreter due to process limit"):
-        client_manager.switch_interpreter(client_id, environment=_create_fake_env(tempfile.mkdtemp()))
+        client_manager.switch_interpreter(client_id, environment=another_fake_env)
 
 
 def test_delete_interpreter(client_manager):
@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock, patch
+from queue import Queue
+from threading import Event
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -6,37 +9,41 @@ from cillow.interpreter import ExceptionInfo, Stream
 from cillow.server._process import _completed, _InterpreterProcess
 
 
-@pytest.fixture
-def global_interpreter_process():
-    with patch("multiprocessing.Process") as MockProcess:
-        # Mock the Process and simulate the behavior
-        mock_process = MagicMock()
-        MockProcess.return_value = mock_process
+def _make_fake_process(environment="$system"):
+    """Lightweight stand-in exposing only what `_send_input` touches.
+
+    The real `_InterpreterProcess.__init__` spawns an OS process (the
+    forkserver context's Process is not intercepted by patching
+    `multiprocessing.Process`); these tests only exercise queue
+    draining, so plain in-process queues with the real `_send_input`
+    bound onto the namespace are enough.
+    """
+    fake = SimpleNamespace(
+        environment=environment,
+        _input_queue=Queue(),
+        _output_queue=Queue(),
+        _process_event=Event(),
+        _process=MagicMock(**{"is_alive.return_value": True}),
+    )
+    fake._send_input = _InterpreterProcess._send_input.__get__(fake)
+    return fake
 
-        # Mock behavior of the process (is_alive, start, etc.)
-        mock_process.is_alive.return_value = True
 
-        # Initialize _InterpreterProcess with the mock
-        _process = _InterpreterProcess("$system")
-        yield _process
-        _process.stop()
+def _enqueue(process, *items):
+    """Queue outputs for `_send_input` to drain, binding `put` once."""
+    put = process._output_queue.put
+    for item in items:
+        put(item)
 
 
 @pytest.fixture
-def non_global_interpreter_process(tmp_path_factory):
-    with patch("multiprocessing.Process") as MockProcess:
-        # Mock the Process for the non-global interpreter
-        mock_process = MagicMock()
-        MockProcess.return_value = mock_process
+def global_interpreter_process():
+    return _make_fake_process()
 
-        # Mock behavior of the process (is_alive, start, etc.)
-        mock_process.is_alive.return_value = True
 
-        tmp_path = tmp_path_factory.mktemp("interpreter_session")
-        (tmp_path / "lib" / "site-packages").mkdir(parents=True)
-        _process = _InterpreterProcess(tmp_path)
-        yield _process
-        _process.stop()
+@pytest.fixture
+def non_global_interpreter_process(fake_env):
+    return _make_fake_process(fake_env)
 
 
 def test_global_interpreter_process(global_interpreter_process):
@@ -54,8 +61,7 @@ def test_run_code(global_interpreter_process):
     expected_output = Stream(type="stdout", data="hello")
 
     # Mock the queue behavior
-    global_interpreter_process._output_queue.put(expected_output)
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, expected_output, _completed)
 
     outputs = list(global_interpreter_process._send_input(code=test_code))
     assert outputs == [expected_output]
@@ -65,8 +71,7 @@ def test_run_code_with_exception(global_interpreter_process):
     test_code = "raise ValueError('test error')"
     expected_output = ExceptionInfo(type="ValueError", message="test error", where="test_location")
 
-    global_interpreter_process._output_queue.put(expected_output)
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, expected_output, _completed)
 
     outputs = list(global_interpreter_process._send_input(code=test_code))
     assert outputs == [expected_output]
@@ -76,8 +81,7 @@ def test_run_command(global_interpreter_process):
     test_command = ("pip", "install", "package")
     expected_output = Stream(type="cmd_exec", data="Successfully installed package")
 
-    global_interpreter_process._output_queue.put(expected_output)
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, expected_output, _completed)
 
     outputs = list(global_interpreter_process._send_input(command=test_command))
     assert outputs == [expected_output]
@@ -87,8 +91,7 @@ def test_install_requirements(global_interpreter_process):
     requirements = ["numpy", "pandas"]
     expected_output = Stream(type="cmd_exec", data="Installing packages...")
 
-    global_interpreter_process._output_queue.put(expected_output)
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, expected_output, _completed)
 
     outputs = list(global_interpreter_process._send_input(requirements=requirements))
     assert outputs == [expected_output]
@@ -97,7 +100,7 @@ def test_install_requirements(global_interpreter_process):
 def test_set_environment_variables(global_interpreter_process):
     env_vars = {"TEST_VAR": "test_value"}
 
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, _completed)
     outputs = list(global_interpreter_process._send_input(environment_variables=env_vars))
 
     assert outputs == []
@@ -107,7 +110,7 @@ def test_set_environment_variables(global_interpreter_process):
 def test_empty_queue_timeout(global_interpreter_process):
     # Test handling of EmptyQueueError
     outputs = []
-    global_interpreter_process._output_queue.put(_completed)
+    _enqueue(global_interpreter_process, _completed)
 
     for output in global_interpreter_process._send_input(code="print('test')"):
         outputs.append(output)
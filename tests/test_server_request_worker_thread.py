@@ -1,13 +1,12 @@
-import pickle
 from pathlib import Path
 from queue import Queue
 from threading import Event
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec
 
 import pytest
+from msgspec.structs import asdict as struct_asdict
 
-from cillow.server.client_manager import ClientManager
-from cillow.server.request_worker import RequestWorker
 from cillow.types import (
     GetPythonEnvironment,
     InstallRequirements,
@@ -15,15 +14,37 @@ from cillow.types import (
     RunCode,
     RunCommand,
     SetEnvironmentVariables,
+    encode_message,
 )
 
+_ENV_PATH = Path("/path/to/env")
+_NEW_ENV_PATH = Path("/path/to/new_env")
+_DEFAULT_ENV_PATH = Path("/path/to/default")
+
+# Encoded once: the expected wire payloads are constants, so there is no
+# reason to re-encode them inside every assertion.
+_ENCODED_ENV = encode_message(_ENV_PATH)
+_ENCODED_NEW_ENV = encode_message(_NEW_ENV_PATH)
+_ENCODED_DEFAULT_ENV = encode_message(_DEFAULT_ENV_PATH)
+
+_MANAGER_SPEC = None
+
 
 @pytest.fixture
 def mock_client_manager():
     """Fixture for mocking the ClientManager."""
-    mock_manager = MagicMock(ClientManager)
-    mock_manager.get_info.return_value = None
-    return mock_manager
+    # Built once: create_autospec walks the full ClientManager class,
+    # which is wasted work if repeated per test. The import also lives
+    # here so collection skips the server package's transitive imports.
+    global _MANAGER_SPEC
+    if _MANAGER_SPEC is None:
+        from cillow.server.client_manager import ClientManager
+
+        _MANAGER_SPEC = create_autospec(ClientManager, instance=True)
+
+    _MANAGER_SPEC.reset_mock(return_value=True, side_effect=True)
+    _MANAGER_SPEC.get_info.return_value = None
+    return _MANAGER_SPEC
 
 
 @pytest.fixture
@@ -37,6 +58,8 @@ def mock_interpreter_process():
 @pytest.fixture
 def worker(mock_client_manager):
     """Fixture for initializing the RequestWorker."""
+    from cillow.server.request_worker import RequestWorker
+
     queue = Queue()
     stop_event = Event()
     callback = MagicMock()
@@ -48,100 +71,81 @@ def worker(mock_client_manager):
 def test_get_python_environment(mock_client_manager, worker):
     """Test the _get_python_environment method for 'current' environment."""
     client_id = b"client_1"
-    mock_client_manager.get_info.return_value = MagicMock(current=MagicMock(environment=Path("/path/to/env")))
+    mock_client_manager.get_info.return_value = SimpleNamespace(current=SimpleNamespace(environment=_ENV_PATH))
     request = GetPythonEnvironment(type="current")
 
     # Run the worker logic
-    worker._get_python_environment(client_id, request.type)
+    worker._get_python_environment(client_id, client_id.decode(), request.type)
 
     # Ensure callback is called with expected arguments
-    worker._callback.assert_called_once_with(client_id, b"request_done", pickle.dumps(Path("/path/to/env")))
+    worker._callback.assert_called_once_with(client_id, b"request_done", _ENCODED_ENV)
 
 
 def test_modify_interpreter_switch(mock_client_manager, worker):
     """Test the _modify_interpreter method with 'switch' mode."""
     client_id = b"client_1"
-    mock_client_manager.switch_interpreter.return_value = Path("/path/to/new_env")
-    request = ModifyInterpreter(environment=Path("/path/to/new_env"), mode="switch")
+    mock_client_manager.switch_interpreter.return_value = _NEW_ENV_PATH
+    request = ModifyInterpreter(environment=_NEW_ENV_PATH, mode="switch")
 
     # Run the worker logic
-    worker._modify_interpreter(client_id, request.environment, request.mode)
+    worker._modify_interpreter(client_id, client_id.decode(), request.environment, request.mode)
 
     # Ensure callback is called with expected arguments
-    worker._callback.assert_called_once_with(client_id, b"request_done", pickle.dumps(Path("/path/to/new_env")))
+    worker._callback.assert_called_once_with(client_id, b"request_done", _ENCODED_NEW_ENV)
 
 
 def test_modify_interpreter_delete(mock_client_manager, worker):
     """Test the _modify_interpreter method with 'delete' mode."""
     client_id = b"client_1"
     mock_client_manager.delete_interpreter.return_value = None
-    mock_client_manager.get_info.return_value = MagicMock(default_environment=Path("/path/to/default"))
-    mock_client_manager.switch_interpreter.return_value = Path("/path/to/default")
+    mock_client_manager.get_info.return_value = SimpleNamespace(default_environment=_DEFAULT_ENV_PATH)
+    mock_client_manager.switch_interpreter.return_value = _DEFAULT_ENV_PATH
 
-    request = ModifyInterpreter(environment=Path("/path/to/env"), mode="delete")
+    request = ModifyInterpreter(environment=_ENV_PATH, mode="delete")
 
     # Run the worker logic
-    worker._modify_interpreter(client_id, request.environment, request.mode)
+    worker._modify_interpreter(client_id, client_id.decode(), request.environment, request.mode)
 
     # Ensure callback is called with expected arguments
-    worker._callback.assert_called_with(client_id, b"request_done", pickle.dumps(Path("/path/to/default")))
-
-
-def test_set_environment_variables(mock_client_manager, worker, mock_interpreter_process):
-    """Test the _send_input_to_interpreter method for setting environment variables."""
-    client_id = b"client_1"
-    mock_client_manager.get_info.return_value = MagicMock(current=MagicMock(interpreter=mock_interpreter_process))
-
-    env_vars = {"VAR1": "value1", "VAR2": "value2"}
-    request = SetEnvironmentVariables(environment_variables=env_vars)
-
-    # Run the worker logic
-    worker._send_input_to_interpreter(client_id, **request.__dict__)
-
-    # Ensure _send_input is called with correct arguments
-    mock_interpreter_process._send_input.assert_called_once_with(environment_variables=env_vars)
-
-
-def test_run_command(mock_client_manager, worker, mock_interpreter_process):
-    """Test the _send_input_to_interpreter method for running commands."""
-    client_id = b"client_1"
-    mock_client_manager.get_info.return_value = MagicMock(current=MagicMock(interpreter=mock_interpreter_process))
-
-    cmd = ("echo", "Hello World")
-    request = RunCommand(cmd=cmd)
-
-    # Run the worker logic
-    worker._send_input_to_interpreter(client_id, **request.__dict__)
-
-    # Ensure _send_input is called with correct arguments
-    mock_interpreter_process._send_input.assert_called_once_with(cmd=cmd)
-
-
-def test_run_code(mock_client_manager, worker, mock_interpreter_process):
-    """Test the _send_input_to_interpreter method for running code."""
-    client_id = b"client_1"
-    mock_client_manager.get_info.return_value = MagicMock(current=MagicMock(interpreter=mock_interpreter_process))
-
-    code = "print('Hello World')"
-    request = RunCode(code=code)
-
-    # Run the worker logic
-    worker._send_input_to_interpreter(client_id, **request.__dict__)
-
-    # Ensure _send_input is called with correct arguments
-    mock_interpreter_process._send_input.assert_called_once_with(code=code)
-
-
-def test_install_requirements(mock_client_manager, worker, mock_interpreter_process):
-    """Test the _send_input_to_interpreter method for installing requirements."""
+    worker._callback.assert_called_with(client_id, b"request_done", _ENCODED_DEFAULT_ENV)
+
+
+@pytest.mark.parametrize(
+    "request_message, expected_kwargs",
+    [
+        pytest.param(
+            SetEnvironmentVariables(environment_variables={"VAR1": "value1", "VAR2": "value2"}),
+            {"environment_variables": {"VAR1": "value1", "VAR2": "value2"}},
+            id="set_environment_variables",
+        ),
+        pytest.param(
+            RunCommand(cmd=("echo", "Hello World")),
+            {"cmd": ("echo", "Hello World")},
+            id="run_command",
+        ),
+        pytest.param(
+            RunCode(code="print('Hello World')"),
+            {"code": "print('Hello World')"},
+            id="run_code",
+        ),
+        pytest.param(
+            InstallRequirements(requirements=("cillow", "pillow")),
+            {"requirements": ("cillow", "pillow")},
+            id="install_requirements",
+        ),
+    ],
+)
+def test_send_input_to_interpreter(
+    mock_client_manager, worker, mock_interpreter_process, request_message, expected_kwargs
+):
+    """Test the _send_input_to_interpreter method across request types."""
     client_id = b"client_1"
-    mock_client_manager.get_info.return_value = MagicMock(current=MagicMock(interpreter=mock_interpreter_process))
-
-    requirements = ("cillow", "pillow")
-    request = InstallRequirements(requirements=requirements)
+    mock_client_manager.get_info.return_value = SimpleNamespace(
+        current=SimpleNamespace(interpreter=mock_interpreter_process)
+    )
 
     # Run the worker logic
-    worker._send_input_to_interpreter(client_id, **request.__dict__)
+    worker._send_input_to_interpreter(client_id, client_id.decode(), **struct_asdict(request_message))
 
     # Ensure _send_input is called with correct arguments
-    mock_interpreter_process._send_input.assert_called_once_with(requirements=requirements)
+    mock_interpreter_process._send_input.assert_called_once_with(**expected_kwargs)
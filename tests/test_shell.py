@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
 from unittest.mock import MagicMock, patch
 
@@ -6,6 +7,9 @@ import pytest
 
 from cillow.shell import Shell
 
+_OS_ENVIRON_KEYS = frozenset(os.environ)
+"""Snapshot of environ keys; avoids re-iterating (and re-decoding) os.environ per assert."""
+
 
 @pytest.fixture
 def temp_workdir(tmp_path):
@@ -63,28 +67,19 @@ def test_run_command_with_error(mock_run, shell):
     assert "standard output" in result
 
 
-@patch("subprocess.Popen")
-def test_stream_command(mock_popen, shell):
+@pytest.mark.slow
+@pytest.mark.skipif(os.name == "nt", reason="Unix-specific test")
+def test_stream_command(shell):
     """Test streaming command execution"""
-    mock_process = MagicMock()
-    mock_process.stdout = ["line1\n", "line2\n"]
-    mock_process.stderr = []
-    mock_popen.return_value = mock_process
-
-    lines = list(shell.stream("echo", "test"))
+    lines = list(shell.stream("printf", "line1\\nline2\\n"))
     assert lines == ["line1\n", "line2\n"]
-    mock_popen.assert_called_once()
 
 
-@patch("subprocess.Popen")
-def test_stream_command_with_error(mock_popen, shell):
+@pytest.mark.slow
+@pytest.mark.skipif(os.name == "nt", reason="Unix-specific test")
+def test_stream_command_with_error(shell):
     """Test streaming command with error output"""
-    mock_process = MagicMock()
-    mock_process.stdout = ["output1\n"]
-    mock_process.stderr = ["error1\n"]
-    mock_popen.return_value = mock_process
-
-    lines = list(shell.stream("invalid_command"))
+    lines = list(shell.stream("sh", "-c", "echo output1; echo error1 1>&2"))
     assert "error1\n" in lines
     assert "output1\n" in lines
 
@@ -103,7 +98,7 @@ def test_run_with_env_vars(mock_run, shell):
     called_kwargs = mock_run.call_args[1]
     assert "env" in called_kwargs
     assert called_kwargs["env"]["TEST_VAR"] == "test_value"
-    assert all(key in called_kwargs["env"] for key in os.environ)
+    assert called_kwargs["env"].keys() >= _OS_ENVIRON_KEYS
 
 
 @pytest.mark.skipif(os.name != "nt", reason="Windows-specific test")
@@ -139,21 +134,14 @@ def test_unix_command_execution(shell):
         assert called_args == ("echo", "test")
 
 
+@pytest.mark.slow
 def test_real_echo_command(shell):
     """Test actual echo command execution"""
     result = shell.run("echo", "test")
     assert "test" in result.lower()
 
 
-def test_real_directory_listing(shell, temp_workdir):
-    """Test actual directory listing command"""
-    test_file = temp_workdir / "test.txt"
-    test_file.touch()
-
-    result = shell.run("dir") if os.name == "nt" else shell.run("ls")
-    assert "test.txt" in result
-
-
+@pytest.mark.slow
 def test_workdir_command_execution(shell, temp_workdir):
     """Test command execution in specified working directory"""
     test_file = temp_workdir / "unique_test_file.txt"
@@ -163,6 +151,7 @@ def test_workdir_command_execution(shell, temp_workdir):
     assert "unique_test_file.txt" in result
 
 
+@pytest.mark.slow
 def test_stream_large_output(shell):
     """Test streaming of large command output"""
     if os.name == "nt":  # noqa: SIM108
@@ -170,19 +159,16 @@ def test_stream_large_output(shell):
     else:
         cmd = ("seq", "1", "5")
 
-    lines = list(shell.stream(*cmd))
-    assert len(lines) == 5
+    # Count without materializing the output; keeps the test's memory
+    # flat however large the streamed output grows.
+    count = sum(1 for _ in shell.stream(*cmd))
+    assert count == 5
 
 
-@pytest.mark.asyncio
-async def test_stream_concurrent_usage(shell):
+@pytest.mark.slow
+def test_stream_concurrent_usage(shell):
     """Test concurrent usage of stream method"""
-    import asyncio
-
-    async def stream_command():
-        return list(shell.stream("echo", "test"))
-
-    tasks = [stream_command() for _ in range(3)]
-    results = await asyncio.gather(*tasks)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda _: list(shell.stream("echo", "test")), range(3)))
 
     assert all(len(result) > 0 for result in results)